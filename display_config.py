@@ -59,6 +59,8 @@ if not hasattr(hid, 'device'):
     print("     pip3 install hidapi")
     sys.exit(1)
 
+from qmk_hid import KeyboardLocator, connect_daemon, datetime_report, report
+
 # USB Vendor and Product IDs
 VENDOR_ID = 0xFEED
 PRODUCT_ID = 0x0000
@@ -67,11 +69,10 @@ PRODUCT_ID = 0x0000
 USAGE_PAGE = 0xFF60
 USAGE = 0x0061
 
-# HID packet size
-HID_PACKET_SIZE = 32
+# Remembers where the keyboard was found, so later runs can skip enumeration
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID, USAGE_PAGE, USAGE)
 
 # Command IDs
-CMD_DATETIME_UPDATE = 0x03
 CMD_MEDIA_UPDATE = 0x02
 CMD_WEATHER_UPDATE = 0x04
 
@@ -104,30 +105,16 @@ WEATHER_NAMES = {
 }
 
 
-def find_keyboard_device():
-    """Find the keyboard HID device."""
-    devices = hid.enumerate()
-
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
-            return device_info['path']
-
-    return None
-
-
 def connect_to_keyboard():
     """Try to connect to the keyboard. Returns device handle or None."""
-    device_path = find_keyboard_device()
-    if not device_path:
-        return None
+    # Send through qmk_hidd.py while it is running
+    device = connect_daemon()
+    if device:
+        return device
 
+    # Reuse the path from the last run; only enumerate if it no longer opens
     try:
-        device = hid.device()
-        device.open_path(device_path)
-        return device
+        return locator.open()
     except Exception as e:
         print(f"✗ Error opening HID device: {e}")
         return None
@@ -135,18 +122,8 @@ def connect_to_keyboard():
 
 def send_datetime_update(device, dt):
     """Send date/time update to keyboard via Raw HID."""
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_DATETIME_UPDATE
-    packet[1] = dt.year & 0xFF
-    packet[2] = (dt.year >> 8) & 0xFF
-    packet[3] = dt.month
-    packet[4] = dt.day
-    packet[5] = dt.hour
-    packet[6] = dt.minute
-    packet[7] = dt.second
-
     try:
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(datetime_report(dt))
         if bytes_written > 0:
             print(f"✓ Date/Time set: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
             return True
@@ -160,13 +137,8 @@ def send_datetime_update(device, dt):
 
 def send_media_update(device, text):
     """Send media text update to keyboard via Raw HID."""
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_MEDIA_UPDATE
-    text_bytes = text.encode('utf-8')[:31]
-    packet[1:1+len(text_bytes)] = text_bytes
-
     try:
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(report(CMD_MEDIA_UPDATE, text.encode('utf-8')))
         if bytes_written > 0:
             if text:
                 print(f"✓ Media text set: \"{text}\"")
@@ -183,12 +155,8 @@ def send_media_update(device, text):
 
 def send_weather_update(device, weather_state):
     """Send weather update to keyboard via Raw HID."""
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_WEATHER_UPDATE
-    packet[1] = weather_state
-
     try:
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(report(CMD_WEATHER_UPDATE, bytes([weather_state])))
         if bytes_written > 0:
             print(f"✓ Weather set: {WEATHER_NAMES[weather_state]}")
             return True
@@ -42,6 +42,8 @@ if not hasattr(hid, 'device'):
     print("     pip3 install hidapi")
     sys.exit(1)
 
+from qmk_hid import KeyboardLocator, connect_daemon, datetime_report, report
+
 # USB Vendor and Product IDs
 VENDOR_ID = 0xFEED
 PRODUCT_ID = 0x0000
@@ -50,69 +52,39 @@ PRODUCT_ID = 0x0000
 USAGE_PAGE = 0xFF60
 USAGE = 0x0061
 
-# HID packet size
-HID_PACKET_SIZE = 32
+# Remembers where the keyboard was found, so later runs can skip enumeration
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID, USAGE_PAGE, USAGE)
 
 # Command IDs
-CMD_DATETIME_UPDATE = 0x03
 CMD_MEDIA_UPDATE = 0x02
 
 # Showcase segments
 SEGMENT_DURATION = 10.0  # 10 seconds per segment
 
 
-def find_keyboard_device():
-    """Find the keyboard HID device."""
-    print(f"Looking for keyboard (VID: 0x{VENDOR_ID:04X}, PID: 0x{PRODUCT_ID:04X})...")
-
-    # List all HID devices
-    devices = hid.enumerate()
-
-    # Find our keyboard by VID/PID and usage page
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
-
-            print(f"✓ Found keyboard: {device_info['product_string']}")
-            return device_info['path']
-
-    return None
-
-
 def connect_to_keyboard():
     """Try to connect to the keyboard. Returns device handle or None."""
-    device_path = find_keyboard_device()
-    if not device_path:
-        return None
+    # Send through qmk_hidd.py while it has the keyboard
+    device = connect_daemon()
+    if device:
+        print("✓ Connected to keyboard through qmk_hidd!\n")
+        return device
 
+    # Reuse the path from the last run; only enumerate if it no longer opens
     try:
-        device = hid.device()
-        device.open_path(device_path)
-        print("✓ Connected to keyboard!\n")
-        return device
-    except Exception as e:
+        device = locator.open()
+    except (OSError, ValueError) as e:
         print(f"✗ Error opening HID device: {e}")
         return None
+    if device:
+        print("✓ Connected to keyboard!\n")
+    return device
 
 
 def send_datetime_update(device, dt):
     """Send date/time update to keyboard via Raw HID."""
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_DATETIME_UPDATE  # Command ID
-
-    # Pack date/time: year (2 bytes), month, day, hour, minute, second
-    packet[1] = dt.year & 0xFF  # Year low byte
-    packet[2] = (dt.year >> 8) & 0xFF  # Year high byte
-    packet[3] = dt.month
-    packet[4] = dt.day
-    packet[5] = dt.hour
-    packet[6] = dt.minute
-    packet[7] = dt.second
-
     try:
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(datetime_report(dt))
         return bytes_written > 0
     except Exception as e:
         print(f"\n✗ Error sending datetime packet: {e}")
@@ -121,17 +93,10 @@ def send_datetime_update(device, dt):
 
 def send_media_update(device, text):
     """Send media text update to keyboard via Raw HID."""
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_MEDIA_UPDATE  # Command ID
-
-    # Convert text to bytes and pack as null-terminated string starting at byte 1
-    # Max 31 bytes for text (packet is 32 bytes, 1 for command ID, rest for text)
-    text_bytes = text.encode('utf-8')[:31]
-    packet[1:1+len(text_bytes)] = text_bytes
-    # Ensure null termination (already zeroed by bytearray initialization)
-
+    # Null-terminated text; report() truncates it to the 31 bytes after the
+    # command ID and zero fills the rest
     try:
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(report(CMD_MEDIA_UPDATE, text.encode('utf-8')))
         return bytes_written > 0
     except Exception as e:
         print(f"\n✗ Error sending media packet: {e}")
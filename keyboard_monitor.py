@@ -4,10 +4,12 @@ QMK Keyboard Companion - Unified Monitor and High Score Manager
 Monitors system volume, media playback, and manages Doodle Jump high scores via Raw HID.
 
 Requirements:
-    - macOS: osascript (built-in)
+    - macOS: CoreAudio and osascript (built-in)
     - Windows: pycaw, comtypes
-    - Linux: pulsectl or amixer
+    - Linux: pulsectl (preferred), pactl or amixer
     - All: hidapi
+    - Optional: orjson (faster weather response and high score file parsing)
+    - Optional (Linux): pyudev (notices keyboard unplug/replug immediately)
 
 Install dependencies:
     pip3 install hidapi pycaw comtypes pulsectl
@@ -20,14 +22,32 @@ Note: If you get import errors, uninstall conflicting packages:
 import time
 import subprocess
 import platform
+import random
+import shutil
 import sys
 import argparse
+import atexit
+import bisect
+import ctypes
+import http.client
 import json
-import urllib.request
+import logging
+import logging.handlers
+import os
+import struct
+import queue
+import re
+import threading
 import urllib.error
 import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+from qmk_hid import HidrawWriter
 
 # Import hidapi - handle potential import issues
 try:
@@ -47,6 +67,47 @@ if not hasattr(hid, 'device'):
     print("     pip3 install hidapi")
     sys.exit(1)
 
+# Prefer orjson for decoding weather API responses and the high score file,
+# fall back to stdlib json (both accept raw bytes, so no separate decode step
+# is needed; json_dumps_indented returns bytes either way)
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Optional: pulsectl (Linux) talks to PulseAudio/PipeWire directly instead of
+# running pactl for every volume read
+try:
+    import pulsectl
+except ImportError:
+    pulsectl = None
+
+# Optional: pyudev (Linux) lets us hear about hidraw hotplug events instead of
+# relying only on the enumeration cache expiring
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+# Status output goes through logging; see setup_logging()
+log = logging.getLogger('keyboard_monitor')
+
+# Platform and Linux volume tool, resolved once instead of on every poll
+SYSTEM = platform.system()
+PACTL_PATH = shutil.which('pactl')  # PulseAudio/PipeWire; amixer is the fallback
+AMIXER_PATH = shutil.which('amixer')
+
+# First percentage in `pactl get-sink-volume` / `amixer get Master` output (bytes)
+PACTL_VOLUME_RE = re.compile(rb'Volume:.*?(\d+)%')
+AMIXER_VOLUME_RE = re.compile(rb'\[(\d+)%\]')
+
 # USB Vendor and Product IDs for your keyboard
 # Update these to match your keyboard's VID/PID from keyboard.json
 VENDOR_ID = 0xFEED
@@ -56,7 +117,8 @@ PRODUCT_ID = 0x0000
 USAGE_PAGE = 0xFF60
 USAGE = 0x0061
 
-# HID packet size (32 bytes for Raw HID)
+# HID packet size (32 bytes for Raw HID). Every report is sent zero-padded to
+# the full endpoint size; some Windows USB stacks handle short packets slowly.
 HID_PACKET_SIZE = 32
 
 # Command IDs for monitor protocol (0x01-0x05: computer → keyboard)
@@ -72,11 +134,33 @@ MSG_ENTER_NAME = 0x11    # Computer → Keyboard: ask for name (top 10)
 MSG_SHOW_SCORES = 0x12   # Computer → Keyboard: display leaderboard
 MSG_NAME_SUBMIT = 0x13   # Keyboard → Computer: name + score
 
+# Incoming game message layouts (after the message type byte)
+SCORE_SUBMIT_FORMAT = struct.Struct('>xH')   # score (uint16, big-endian)
+NAME_SUBMIT_FORMAT = struct.Struct('>x3sH')  # name (3 chars), score (uint16, big-endian)
+
+# Outgoing SHOW_SCORES layout: [MSG, start index, count, entries...]
+SHOW_SCORES_ENTRY_FORMAT = struct.Struct('>3sH')  # name (3 chars), score (uint16, big-endian)
+SHOW_SCORES_PER_PACKET = (HID_PACKET_SIZE - 3) // SHOW_SCORES_ENTRY_FORMAT.size  # 5
+
+# Longest media text the keyboard accepts (UTF-8 bytes, plus null terminator)
+MEDIA_TEXT_MAX_BYTES = HID_PACKET_SIZE - 2
+
 # Poll intervals
 POLL_INTERVAL = 0.1
+VOLUME_DEBOUNCE = 0.05  # Send a new volume once it has been stable this long...
+VOLUME_MAX_DELAY = 0.3  # ...or at the latest this long after it started changing
+VOLUME_RECHECK_INTERVAL = 5.0  # With change notifications, still re-read volume this often
 MEDIA_POLL_INTERVAL = 1.0  # Check media every second
-DATETIME_UPDATE_INTERVAL = 60.0  # Send time every 60 seconds
+DATETIME_UPDATE_INTERVAL = 60.0  # Send time at the start of every minute
 WEATHER_UPDATE_INTERVAL = 600.0  # Check weather every 10 minutes (600 seconds)
+WEATHER_MAX_INTERVAL = 3600.0  # Back off to at most hourly checks while the weather is unchanged
+HID_READ_TIMEOUT = 1.0  # Reader thread checks for shutdown at least this often
+ENUMERATE_CACHE_TTL = 5.0  # Reuse a HID enumeration result for up to 5 seconds
+# Re-enumerate this often to confirm the keyboard is still there. Unplugging is
+# normally noticed sooner, from read/write errors or udev hotplug events.
+CONNECTION_CHECK_INTERVAL = 30.0
+RECONNECT_DELAY = 2.0  # First reconnect attempt 2 seconds after losing the keyboard...
+RECONNECT_MAX_DELAY = 30.0  # ...backing off to one attempt every 30 seconds
 
 # High score file
 SCRIPT_DIR = Path(__file__).parent
@@ -91,81 +175,82 @@ class HighScoreManager:
     """Manages high scores for Doodle Jump game."""
 
     def __init__(self):
+        self.saved_payload = None  # JSON last read from / written to SCORES_FILE
         self.scores = self.load_scores()
 
     def load_scores(self):
         """Load high scores from JSON file"""
         if SCORES_FILE.exists():
             try:
-                with open(SCORES_FILE, 'r') as f:
-                    data = json.load(f)
+                with open(SCORES_FILE, 'rb') as f:
+                    data = json_loads(f.read())
                     # Ensure scores are sorted
                     data.sort(key=lambda x: x['score'], reverse=True)
-                    return data[:10]  # Keep only top 10
+                    data = data[:10]  # Keep only top 10
+                    self.saved_payload = json_dumps_indented(data)
+                    return data
             except Exception as e:
-                print(f"⚠ Error loading scores: {e}")
+                log.warning("⚠ Error loading scores: %s", e)
                 return []
         return []
 
     def save_scores(self):
-        """Save high scores to JSON file"""
+        """Save high scores to JSON file (atomically, and only if they changed)"""
+        payload = json_dumps_indented(self.scores)
+        if payload == self.saved_payload:
+            return
+
         try:
-            with open(SCORES_FILE, 'w') as f:
-                json.dump(self.scores, f, indent=2)
-            print(f"💾 Saved {len(self.scores)} scores to {SCORES_FILE}")
+            tmp_file = SCORES_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_file.replace(SCORES_FILE)
+            self.saved_payload = payload
+            log.info("💾 Saved %d scores to %s", len(self.scores), SCORES_FILE)
         except Exception as e:
-            print(f"⚠ Error saving scores: {e}")
+            log.warning("⚠ Error saving scores: %s", e)
+
+    def rank_of(self, score):
+        """Return the index a new score would be inserted at (after equal scores)"""
+        # self.scores is kept sorted by score, descending, and holds at most 10
+        # entries; bisect's key= argument needs Python 3.10, so bisect the
+        # negated scores instead
+        return bisect.bisect_right([-entry['score'] for entry in self.scores], -score)
 
     def add_score(self, name, score):
         """Add a new score and return its rank (0-9) or -1 if not in top 10"""
-        # Add the new score
-        self.scores.append({'name': name, 'score': score})
+        rank = self.rank_of(score)
+        if rank >= 10:
+            return -1
 
-        # Sort by score (descending)
-        self.scores.sort(key=lambda x: x['score'], reverse=True)
-
-        # Find rank
-        for i, entry in enumerate(self.scores):
-            if entry['name'] == name and entry['score'] == score:
-                rank = i
-                break
-        else:
-            rank = -1
-
-        # Keep only top 10
-        self.scores = self.scores[:10]
+        self.scores.insert(rank, {'name': name, 'score': score})
+        del self.scores[10:]  # Keep only top 10
 
         # Save to file
         self.save_scores()
 
-        return rank if rank < 10 else -1
+        return rank
 
     def check_score(self, score):
         """Check if score makes top 10, return rank or -1"""
-        if len(self.scores) < 10:
-            return len(self.scores)  # Automatic entry
-
-        # Check if score beats the lowest top 10 score
-        if score > self.scores[9]['score']:
-            # Find where it would rank
-            for i, entry in enumerate(self.scores):
-                if score > entry['score']:
-                    return i
-            return 9
+        if len(self.scores) >= 10 and score <= self.scores[9]['score']:
+            return -1  # Didn't make top 10
 
-        return -1  # Didn't make top 10
+        return self.rank_of(score)
 
     def print_scores(self):
         """Print current high scores to console"""
         if self.scores:
-            print("\n" + "=" * 40)
-            print("        DOODLE JUMP HIGH SCORES")
-            print("=" * 40)
+            log.info("\n" + "=" * 40)
+            log.info("        DOODLE JUMP HIGH SCORES")
+            log.info("=" * 40)
             for i, entry in enumerate(self.scores):
-                print(f"  {i+1:2d}. {entry['name']:3s}  {entry['score']:5d}")
-            print("=" * 40 + "\n")
+                log.info("  %2d. %-3s  %5d", i + 1, entry['name'], entry['score'])
+            log.info("=" * 40 + "\n")
         else:
-            print("\n📊 No high scores yet!\n")
+            log.info("\n📊 No high scores yet!\n")
 
 
 # ============================================================================
@@ -187,21 +272,75 @@ WEATHER_OVERCAST = 8     # Overcast (5 white clouds, no precipitation)
 WEATHER_RAIN = WEATHER_RAIN_MEDIUM
 WEATHER_SNOW = WEATHER_SNOW_MEDIUM
 
+WEATHER_NAMES = {
+    WEATHER_SUNNY: "Sunny",
+    WEATHER_RAIN_LIGHT: "Light Rain",
+    WEATHER_RAIN_MEDIUM: "Rain",
+    WEATHER_RAIN_HEAVY: "Heavy Rain",
+    WEATHER_SNOW_LIGHT: "Light Snow",
+    WEATHER_SNOW_MEDIUM: "Snow",
+    WEATHER_SNOW_HEAVY: "Heavy Snow",
+    WEATHER_CLOUDY: "Partly Cloudy",
+    WEATHER_OVERCAST: "Overcast"
+}
+
 # Wind intensity constants (match keyboard firmware)
 WIND_NONE = 0
 WIND_LIGHT = 1
 WIND_MEDIUM = 2
 WIND_HIGH = 3
 
+WIND_INTENSITY_NAMES = {
+    WIND_NONE: "None",
+    WIND_LIGHT: "Light",
+    WIND_MEDIUM: "Medium",
+    WIND_HIGH: "High"
+}
+
 # Wind direction constants (match keyboard firmware)
 WIND_LEFT = 0   # Wind blowing from east (right to left on screen)
 WIND_RIGHT = 1  # Wind blowing from west (left to right on screen)
 
+WIND_DIRECTION_NAMES = {
+    WIND_LEFT: "East (←)",
+    WIND_RIGHT: "West (→)"
+}
+
 # Default location (Otterndorf, Germany)
 DEFAULT_WEATHER_LATITUDE = 53.800
 DEFAULT_WEATHER_LONGITUDE = 8.900
 DEFAULT_WEATHER_LOCATION = "Otterndorf, Germany"
 
+# Network retry settings for weather fetches
+FETCH_ATTEMPTS = 3
+FETCH_RETRY_DELAY = 0.25  # Doubles after each failed attempt (0.25s, 0.5s, ...)
+
+
+def fetch_json(url):
+    """
+    Fetch and decode a JSON document, retrying transient network errors.
+
+    Retries back off exponentially with +/-20% jitter, so a single DNS or
+    connection hiccup doesn't drop a whole weather poll. Client errors (HTTP 4xx)
+    are not retried.
+
+    Args:
+        url: URL to fetch
+
+    Returns:
+        Decoded JSON data (raises the last error if all attempts fail)
+    """
+    for attempt in range(FETCH_ATTEMPTS):
+        try:
+            with urllib.request.urlopen(url, timeout=10) as response:
+                return json_loads(response.read())
+        except (OSError, http.client.HTTPException) as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code < 500:
+                raise
+            if attempt == FETCH_ATTEMPTS - 1:
+                raise
+            time.sleep(FETCH_RETRY_DELAY * (2 ** attempt) * random.uniform(0.8, 1.2))
+
 
 def get_weather_openmeteo(latitude, longitude):
     """
@@ -220,130 +359,140 @@ def get_weather_openmeteo(latitude, longitude):
     try:
         # Open-Meteo API endpoint (include wind speed and direction)
         url = f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true"
-
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-
-            # Get current weather code
-            # WMO Weather interpretation codes (WW)
-            # https://open-meteo.com/en/docs
-            weather_code = data['current_weather']['weathercode']
-
-            # Get wind data
-            wind_speed_kmh = data['current_weather']['windspeed']  # km/h
-            wind_direction_deg = data['current_weather']['winddirection']  # degrees
-
-            # Map WMO codes to our weather states with rain intensity
-            # 0: Clear sky
-            # 1-3: Mainly clear, partly cloudy, overcast
-            # 45, 48: Fog
-            # 51-55: Drizzle (light to moderate)
-            # 56-57: Freezing drizzle
-            # 61-65: Rain (light to heavy)
-            # 66-67: Freezing rain
-            # 71-75: Snow fall
-            # 77: Snow grains
-            # 80-82: Rain showers (slight to violent)
-            # 85-86: Snow showers
-            # 95: Thunderstorm
-            # 96, 99: Thunderstorm with hail
-
-            # Determine weather state
-            if weather_code in [71]:
-                # Light snow fall
-                weather_state = WEATHER_SNOW_LIGHT
-            elif weather_code in [73]:
-                # Moderate snow fall
-                weather_state = WEATHER_SNOW_MEDIUM
-            elif weather_code in [75, 77, 85, 86]:
-                # Heavy snow fall, snow grains, snow showers
-                weather_state = WEATHER_SNOW_HEAVY
-            elif weather_code in [51, 61, 80]:
-                # Light rain: slight drizzle (51), slight rain (61), slight rain showers (80)
-                weather_state = WEATHER_RAIN_LIGHT
-            elif weather_code in [53, 63, 81]:
-                # Medium rain: moderate drizzle (53), moderate rain (63), moderate rain showers (81)
-                weather_state = WEATHER_RAIN_MEDIUM
-            elif weather_code in [55, 56, 57, 65, 66, 67, 82, 95, 96, 99]:
-                # Heavy rain: dense drizzle (55), freezing drizzle (56-57), heavy rain (65),
-                # freezing rain (66-67), violent rain showers (82), thunderstorms (95-99)
-                weather_state = WEATHER_RAIN_HEAVY
-            elif weather_code in [2]:
-                # Partly cloudy
-                weather_state = WEATHER_CLOUDY
-            elif weather_code in [3]:
-                # Overcast
-                weather_state = WEATHER_OVERCAST
-            else:
-                # Clear sky (0), mainly clear (1), or fog (45, 48) -> Sunny
-                weather_state = WEATHER_SUNNY
-
-            # Map wind speed (km/h) to intensity
-            # Beaufort scale reference:
-            # 0-5 km/h: Calm (0)
-            # 6-20 km/h: Light breeze (1-2)
-            # 21-40 km/h: Moderate breeze (3-4)
-            # 41+ km/h: Strong breeze and above (5+)
-            if wind_speed_kmh < 6:
-                wind_intensity = WIND_NONE
-            elif wind_speed_kmh < 21:
-                wind_intensity = WIND_LIGHT
-            elif wind_speed_kmh < 41:
-                wind_intensity = WIND_MEDIUM
-            else:
-                wind_intensity = WIND_HIGH
-
-            # Map wind direction (meteorological degrees) to screen direction
-            # Meteorological convention: direction wind is COMING FROM
-            # Screen mapping:
-            #   - West wind (225-315°) = blowing from west = moves RIGHT on screen
-            #   - East wind (45-135°) = blowing from east = moves LEFT on screen
-            #   - North wind (315-45°) = from north = pick dominant east/west component
-            #   - South wind (135-225°) = from south = pick dominant east/west component
-            #
-            # For N/S winds, ensure they still show with medium-high intensity
-            if 225 <= wind_direction_deg < 315:
-                # West wind (NW-W-SW) -> blows RIGHT (west to east)
+        data = fetch_json(url)
+
+        # Get current weather code
+        # WMO Weather interpretation codes (WW)
+        # https://open-meteo.com/en/docs
+        weather_code = data['current_weather']['weathercode']
+
+        # Get wind data
+        wind_speed_kmh = data['current_weather']['windspeed']  # km/h
+        wind_direction_deg = data['current_weather']['winddirection']  # degrees
+
+        # Map WMO codes to our weather states with rain intensity
+        # 0: Clear sky
+        # 1-3: Mainly clear, partly cloudy, overcast
+        # 45, 48: Fog
+        # 51-55: Drizzle (light to moderate)
+        # 56-57: Freezing drizzle
+        # 61-65: Rain (light to heavy)
+        # 66-67: Freezing rain
+        # 71-75: Snow fall
+        # 77: Snow grains
+        # 80-82: Rain showers (slight to violent)
+        # 85-86: Snow showers
+        # 95: Thunderstorm
+        # 96, 99: Thunderstorm with hail
+
+        # Determine weather state
+        if weather_code in [71]:
+            # Light snow fall
+            weather_state = WEATHER_SNOW_LIGHT
+        elif weather_code in [73]:
+            # Moderate snow fall
+            weather_state = WEATHER_SNOW_MEDIUM
+        elif weather_code in [75, 77, 85, 86]:
+            # Heavy snow fall, snow grains, snow showers
+            weather_state = WEATHER_SNOW_HEAVY
+        elif weather_code in [51, 61, 80]:
+            # Light rain: slight drizzle (51), slight rain (61), slight rain showers (80)
+            weather_state = WEATHER_RAIN_LIGHT
+        elif weather_code in [53, 63, 81]:
+            # Medium rain: moderate drizzle (53), moderate rain (63), moderate rain showers (81)
+            weather_state = WEATHER_RAIN_MEDIUM
+        elif weather_code in [55, 56, 57, 65, 66, 67, 82, 95, 96, 99]:
+            # Heavy rain: dense drizzle (55), freezing drizzle (56-57), heavy rain (65),
+            # freezing rain (66-67), violent rain showers (82), thunderstorms (95-99)
+            weather_state = WEATHER_RAIN_HEAVY
+        elif weather_code in [2]:
+            # Partly cloudy
+            weather_state = WEATHER_CLOUDY
+        elif weather_code in [3]:
+            # Overcast
+            weather_state = WEATHER_OVERCAST
+        else:
+            # Clear sky (0), mainly clear (1), or fog (45, 48) -> Sunny
+            weather_state = WEATHER_SUNNY
+
+        # Map wind speed (km/h) to intensity
+        # Beaufort scale reference:
+        # 0-5 km/h: Calm (0)
+        # 6-20 km/h: Light breeze (1-2)
+        # 21-40 km/h: Moderate breeze (3-4)
+        # 41+ km/h: Strong breeze and above (5+)
+        if wind_speed_kmh < 6:
+            wind_intensity = WIND_NONE
+        elif wind_speed_kmh < 21:
+            wind_intensity = WIND_LIGHT
+        elif wind_speed_kmh < 41:
+            wind_intensity = WIND_MEDIUM
+        else:
+            wind_intensity = WIND_HIGH
+
+        # Map wind direction (meteorological degrees) to screen direction
+        # Meteorological convention: direction wind is COMING FROM
+        # Screen mapping:
+        #   - West wind (225-315°) = blowing from west = moves RIGHT on screen
+        #   - East wind (45-135°) = blowing from east = moves LEFT on screen
+        #   - North wind (315-45°) = from north = pick dominant east/west component
+        #   - South wind (135-225°) = from south = pick dominant east/west component
+        #
+        # For N/S winds, ensure they still show with medium-high intensity
+        if 225 <= wind_direction_deg < 315:
+            # West wind (NW-W-SW) -> blows RIGHT (west to east)
+            wind_display_direction = WIND_RIGHT
+        elif 45 <= wind_direction_deg < 135:
+            # East wind (NE-E-SE) -> blows LEFT (east to west)
+            wind_display_direction = WIND_LEFT
+        else:
+            # North (315-45) or South (135-225) wind
+            # Determine if it has more west or east component
+            # North: 315-360 and 0-45
+            # South: 135-225
+            if (wind_direction_deg >= 315 or wind_direction_deg < 22.5) or (157.5 <= wind_direction_deg < 202.5):
+                # More northerly/southerly - lean west (most common for dramatic effect)
                 wind_display_direction = WIND_RIGHT
-            elif 45 <= wind_direction_deg < 135:
-                # East wind (NE-E-SE) -> blows LEFT (east to west)
+                # Boost intensity for pure N/S winds to make them visible
+                if wind_intensity == WIND_LIGHT:
+                    wind_intensity = WIND_MEDIUM
+            elif 22.5 <= wind_direction_deg < 67.5 or 112.5 <= wind_direction_deg < 157.5:
+                # Northeast or Southeast component
                 wind_display_direction = WIND_LEFT
+                # Boost intensity for pure N/S winds to make them visible
+                if wind_intensity == WIND_LIGHT:
+                    wind_intensity = WIND_MEDIUM
+            elif 292.5 <= wind_direction_deg < 337.5 or 202.5 <= wind_direction_deg < 247.5:
+                # Northwest or Southwest component
+                wind_display_direction = WIND_RIGHT
+                # Boost intensity for pure N/S winds to make them visible
+                if wind_intensity == WIND_LIGHT:
+                    wind_intensity = WIND_MEDIUM
             else:
-                # North (315-45) or South (135-225) wind
-                # Determine if it has more west or east component
-                # North: 315-360 and 0-45
-                # South: 135-225
-                if (wind_direction_deg >= 315 or wind_direction_deg < 22.5) or (157.5 <= wind_direction_deg < 202.5):
-                    # More northerly/southerly - lean west (most common for dramatic effect)
-                    wind_display_direction = WIND_RIGHT
-                    # Boost intensity for pure N/S winds to make them visible
-                    if wind_intensity == WIND_LIGHT:
-                        wind_intensity = WIND_MEDIUM
-                elif 22.5 <= wind_direction_deg < 67.5 or 112.5 <= wind_direction_deg < 157.5:
-                    # Northeast or Southeast component
-                    wind_display_direction = WIND_LEFT
-                    # Boost intensity for pure N/S winds to make them visible
-                    if wind_intensity == WIND_LIGHT:
-                        wind_intensity = WIND_MEDIUM
-                elif 292.5 <= wind_direction_deg < 337.5 or 202.5 <= wind_direction_deg < 247.5:
-                    # Northwest or Southwest component
-                    wind_display_direction = WIND_RIGHT
-                    # Boost intensity for pure N/S winds to make them visible
-                    if wind_intensity == WIND_LIGHT:
-                        wind_intensity = WIND_MEDIUM
-                else:
-                    # Default to right
-                    wind_display_direction = WIND_RIGHT
-                    if wind_intensity == WIND_LIGHT:
-                        wind_intensity = WIND_MEDIUM
-
-            return (weather_state, wind_intensity, wind_display_direction)
+                # Default to right
+                wind_display_direction = WIND_RIGHT
+                if wind_intensity == WIND_LIGHT:
+                    wind_intensity = WIND_MEDIUM
+
+        return (weather_state, wind_intensity, wind_display_direction)
 
     except Exception as e:
-        print(f"⚠ Error fetching weather from Open-Meteo: {e}")
+        log.warning("⚠ Error fetching weather from Open-Meteo: %s", e)
         return (None, None, None)
 
 
+# Map wttr.in weather codes to our states with rain and snow intensity
+# Full list: https://github.com/chubin/wttr.in/blob/master/lib/constants.py
+WTTR_LIGHT_SNOW_CODES = frozenset({179, 227, 323, 326})  # Patchy possible, blowing, patchy light, light snow
+WTTR_MEDIUM_SNOW_CODES = frozenset({182, 185, 230, 311, 314, 317, 320, 329, 332, 335, 350})  # Moderate, sleet, freezing
+WTTR_HEAVY_SNOW_CODES = frozenset({281, 284, 338, 371, 374, 377, 392, 395})  # Heavy, showers, thunder
+WTTR_LIGHT_RAIN_CODES = frozenset({176, 263, 293, 353})  # Patchy rain, light drizzle, light rain shower
+WTTR_MEDIUM_RAIN_CODES = frozenset({266, 296, 299, 356, 359, 362})  # Moderate rain, drizzle
+WTTR_HEAVY_RAIN_CODES = frozenset({302, 305, 308, 365, 368, 386, 389})  # Heavy rain, torrential showers, thunderstorms
+WTTR_PARTLY_CLOUDY_CODES = frozenset({116})
+WTTR_OVERCAST_CODES = frozenset({119, 122})  # Cloudy, overcast
+
+
 def get_weather_wttr(location):
     """
     Fetch weather from wttr.in API (no API key required).
@@ -352,76 +501,102 @@ def get_weather_wttr(location):
         location: City name (e.g., "San Francisco" or "London,UK")
 
     Returns:
-        Weather state (WEATHER_SUNNY, WEATHER_RAIN, WEATHER_SNOW) or None on error
+        Tuple of (weather_state, None, None) or (None, None, None) on error
+        (wttr.in doesn't provide reliable wind data)
     """
     try:
         # wttr.in API endpoint
         # Encode location for URL
         location_encoded = urllib.parse.quote(location)
         url = f"https://wttr.in/{location_encoded}?format=j1"
+        data = fetch_json(url)
+
+        # Get current condition
+        current = data['current_condition'][0]
+        weather_desc = current['weatherDesc'][0]['value'].lower()
+        weather_code = int(current['weatherCode'])
+
+        # Check snow codes and descriptions
+        if weather_code in WTTR_HEAVY_SNOW_CODES or 'heavy snow' in weather_desc or 'blizzard' in weather_desc or 'snow shower' in weather_desc:
+            weather_state = WEATHER_SNOW_HEAVY
+        elif weather_code in WTTR_MEDIUM_SNOW_CODES or ('moderate' in weather_desc and 'snow' in weather_desc):
+            weather_state = WEATHER_SNOW_MEDIUM
+        elif weather_code in WTTR_LIGHT_SNOW_CODES or ('light' in weather_desc and 'snow' in weather_desc) or ('patchy' in weather_desc and 'snow' in weather_desc):
+            weather_state = WEATHER_SNOW_LIGHT
+        elif 'snow' in weather_desc:
+            # Fallback: generic snow without intensity -> medium
+            weather_state = WEATHER_SNOW_MEDIUM
+        elif weather_code in WTTR_HEAVY_RAIN_CODES or 'heavy' in weather_desc or 'torrential' in weather_desc or 'thunder' in weather_desc:
+            weather_state = WEATHER_RAIN_HEAVY
+        elif weather_code in WTTR_MEDIUM_RAIN_CODES or 'moderate' in weather_desc:
+            weather_state = WEATHER_RAIN_MEDIUM
+        elif weather_code in WTTR_LIGHT_RAIN_CODES or 'light' in weather_desc or 'patchy' in weather_desc or 'drizzle' in weather_desc:
+            weather_state = WEATHER_RAIN_LIGHT
+        elif 'rain' in weather_desc or 'shower' in weather_desc:
+            # Fallback: generic rain without intensity -> medium
+            weather_state = WEATHER_RAIN_MEDIUM
+        elif weather_code in WTTR_PARTLY_CLOUDY_CODES or 'partly cloudy' in weather_desc:
+            # Partly cloudy
+            weather_state = WEATHER_CLOUDY
+        elif weather_code in WTTR_OVERCAST_CODES or 'cloudy' in weather_desc or 'overcast' in weather_desc:
+            # Cloudy/Overcast
+            weather_state = WEATHER_OVERCAST
+        else:
+            # Clear/Sunny (113) or other
+            weather_state = WEATHER_SUNNY
 
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-
-            # Get current condition
-            current = data['current_condition'][0]
-            weather_desc = current['weatherDesc'][0]['value'].lower()
-            weather_code = int(current['weatherCode'])
-
-            # Map wttr.in weather codes to our states with rain and snow intensity
-            # Full list: https://github.com/chubin/wttr.in/blob/master/lib/constants.py
-            # Light snow: 179, 227, 323, 326 (patchy light, light snow)
-            # Medium snow: 182, 185, 230, 311, 314, 317, 320, 329, 332, 335, 350 (moderate snow, sleet, freezing)
-            # Heavy snow: 281, 284, 338, 371, 374, 377, 392, 395 (heavy snow, snow showers, thunder)
-            # Light rain: 176, 263, 293, 353
-            # Medium rain: 266, 296, 299, 356, 359, 362
-            # Heavy rain: 302, 305, 308, 365, 368, 386, 389
-
-            light_snow_codes = [179, 227, 323, 326]  # Patchy possible, blowing, patchy light, light snow
-            medium_snow_codes = [182, 185, 230, 311, 314, 317, 320, 329, 332, 335, 350]  # Moderate, sleet, freezing
-            heavy_snow_codes = [281, 284, 338, 371, 374, 377, 392, 395]  # Heavy, showers, thunder
-            light_rain_codes = [176, 263, 293, 353]  # Patchy rain, light drizzle, light rain shower
-            medium_rain_codes = [266, 296, 299, 356, 359, 362]  # Moderate rain, drizzle
-            heavy_rain_codes = [302, 305, 308, 365, 368, 386, 389]  # Heavy rain, torrential showers, thunderstorms
-
-            # Check snow codes and descriptions
-            if weather_code in heavy_snow_codes or 'heavy snow' in weather_desc or 'blizzard' in weather_desc or 'snow shower' in weather_desc:
-                return WEATHER_SNOW_HEAVY
-            elif weather_code in medium_snow_codes or ('moderate' in weather_desc and 'snow' in weather_desc):
-                return WEATHER_SNOW_MEDIUM
-            elif weather_code in light_snow_codes or ('light' in weather_desc and 'snow' in weather_desc) or ('patchy' in weather_desc and 'snow' in weather_desc):
-                return WEATHER_SNOW_LIGHT
-            elif 'snow' in weather_desc:
-                # Fallback: generic snow without intensity -> medium
-                return WEATHER_SNOW_MEDIUM
-            elif weather_code in heavy_rain_codes or 'heavy' in weather_desc or 'torrential' in weather_desc or 'thunder' in weather_desc:
-                return WEATHER_RAIN_HEAVY
-            elif weather_code in medium_rain_codes or 'moderate' in weather_desc:
-                return WEATHER_RAIN_MEDIUM
-            elif weather_code in light_rain_codes or 'light' in weather_desc or 'patchy' in weather_desc or 'drizzle' in weather_desc:
-                return WEATHER_RAIN_LIGHT
-            elif 'rain' in weather_desc or 'shower' in weather_desc:
-                # Fallback: generic rain without intensity -> medium
-                return WEATHER_RAIN_MEDIUM
-            elif weather_code in [116] or 'partly cloudy' in weather_desc:
-                # Partly cloudy
-                return WEATHER_CLOUDY
-            elif weather_code in [119, 122] or 'cloudy' in weather_desc or 'overcast' in weather_desc:
-                # Cloudy/Overcast
-                return WEATHER_OVERCAST
-            else:
-                # Clear/Sunny (113) or other
-                weather_state = WEATHER_SUNNY
-
-            # wttr.in doesn't provide reliable wind data, return None for wind
-            return (weather_state, None, None)
+        # wttr.in doesn't provide reliable wind data, return None for wind
+        return (weather_state, None, None)
 
     except Exception as e:
-        print(f"⚠ Error fetching weather from wttr.in: {e}")
+        log.warning("⚠ Error fetching weather from wttr.in: %s", e)
         return (None, None, None)
 
 
-def get_current_weather(location=None, latitude=None, longitude=None):
+# On-disk weather cache, so reconnects and restarts don't refetch data that is
+# still fresh (and a failed fetch can fall back to the last known conditions)
+WEATHER_CACHE_FILE = Path.home() / ".cache" / "qmk_companion" / "weather.json"
+WEATHER_CACHE_MAX_AGE = 300.0       # Reuse cached weather on (re)connect for up to 5 minutes
+WEATHER_CACHE_STALE_LIMIT = 10800.0  # Fall back to cached weather up to 3 hours old on errors
+
+
+def weather_cache_key(location, latitude, longitude):
+    """Build the cache key for a location (coordinates rounded to ~1 km)."""
+    lat = round(latitude, 2) if latitude is not None else None
+    lon = round(longitude, 2) if longitude is not None else None
+    return f"{lat},{lon},{location}"
+
+
+def read_weather_cache(key):
+    """Return (age_seconds, weather_tuple) for a cache key, or None if not cached."""
+    try:
+        with open(WEATHER_CACHE_FILE, 'r') as f:
+            entry = json.load(f).get(key)
+        return (time.time() - entry['time'], tuple(entry['weather']))
+    except Exception:
+        return None
+
+
+def write_weather_cache(key, weather):
+    """Store a weather tuple in the cache (written atomically via a temp file)."""
+    try:
+        try:
+            with open(WEATHER_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+        except Exception:
+            cache = {}
+        cache[key] = {'time': time.time(), 'weather': list(weather)}
+
+        WEATHER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = WEATHER_CACHE_FILE.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        tmp_file.replace(WEATHER_CACHE_FILE)
+    except Exception as e:
+        log.warning("⚠ Error writing weather cache: %s", e)
+
+
+def get_current_weather(location=None, latitude=None, longitude=None, max_age=0):
     """
     Get current weather condition and wind data using available APIs.
 
@@ -429,24 +604,36 @@ def get_current_weather(location=None, latitude=None, longitude=None):
         location: City name (for wttr.in)
         latitude: Latitude (for Open-Meteo)
         longitude: Longitude (for Open-Meteo)
+        max_age: Return a cached result instead of fetching if it is younger than this (seconds)
 
     Returns:
         Tuple of (weather_state, wind_intensity, wind_direction) or (None, None, None)
         Note: wttr.in API doesn't provide wind, so wind will be None if using location only
     """
+    cache_key = weather_cache_key(location, latitude, longitude)
+    cached = read_weather_cache(cache_key)
+    if cached is not None and cached[0] < max_age:
+        return cached[1]
+
     # Try Open-Meteo first if coordinates provided (has wind data)
     if latitude is not None and longitude is not None:
         result = get_weather_openmeteo(latitude, longitude)
         if result[0] is not None:
+            write_weather_cache(cache_key, result)
             return result
 
     # Try wttr.in if location provided (no wind data)
     if location is not None:
         result = get_weather_wttr(location)
         if result[0] is not None:
+            write_weather_cache(cache_key, result)
             return result
 
-    # All APIs failed
+    # All APIs failed, fall back to the last known weather if it isn't too old
+    if cached is not None and cached[0] < WEATHER_CACHE_STALE_LIMIT:
+        log.warning("⚠ Using cached weather from %.0f minutes ago", cached[0] / 60)
+        return cached[1]
+
     return (None, None, None)
 
 
@@ -456,6 +643,11 @@ def get_current_weather(location=None, latitude=None, longitude=None):
 
 def get_volume_macos():
     """Get system volume on macOS (0-100)."""
+    volume = get_volume_coreaudio()
+    if volume is not None:
+        return volume
+
+    # CoreAudio couldn't tell, ask AppleScript (spawns osascript)
     try:
         result = subprocess.run(
             ['osascript', '-e', 'output volume of (get volume settings)'],
@@ -466,85 +658,452 @@ def get_volume_macos():
         volume = int(result.stdout.strip())
         return volume
     except Exception as e:
-        print(f"⚠ Error getting macOS volume: {e}")
+        log.warning("⚠ Error getting macOS volume: %s", e)
         return None
 
 
+# Activated IAudioEndpointVolume, kept per thread because a COM interface
+# belongs to the thread that created it (created on first use)
+_windows_volume = threading.local()
+
+# Bumped whenever the default output device changes. A cached interface keeps
+# reading the old speakers without any error, so each thread compares this
+# with the generation its interface was activated in.
+_windows_device_generation = 0
+
+# Registered IMMNotificationClient (None until first use, False if unavailable)
+_windows_device_notifier = None
+
+
+def watch_windows_default_device():
+    """Register for default output device changes (Windows).
+
+    Returns the registration to keep alive, or False if this pycaw can't do it,
+    in which case a cached interface is only replaced after a read fails.
+    """
+    try:
+        from comtypes import COMObject
+        from pycaw.api.mmdeviceapi import IMMNotificationClient
+        from pycaw.pycaw import AudioUtilities
+
+        class Notifier(COMObject):
+            _com_interfaces_ = [IMMNotificationClient]
+
+            def OnDefaultDeviceChanged(self, flow, role, device_id):
+                global _windows_device_generation
+                _windows_device_generation += 1
+
+        enumerator = AudioUtilities.GetDeviceEnumerator()
+        notifier = Notifier()
+        enumerator.RegisterEndpointNotificationCallback(notifier)
+        return (enumerator, notifier)
+    except Exception as e:
+        log.debug("Could not watch for default audio device changes: %s", e)
+        return False
+
+
 def get_volume_windows():
     """Get system volume on Windows (0-100)."""
+    global _windows_device_notifier
     try:
-        from ctypes import cast, POINTER
-        from comtypes import CLSCTX_ALL
-        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-
-        devices = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(
-            IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
+        volume_interface = getattr(_windows_volume, 'interface', None)
+        if (volume_interface is None or
+                _windows_volume.generation != _windows_device_generation):
+            from ctypes import cast, POINTER
+            from comtypes import CLSCTX_ALL
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+            if _windows_device_notifier is None:
+                _windows_device_notifier = watch_windows_default_device()
+
+            _windows_volume.generation = _windows_device_generation
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(
+                IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
+            _windows_volume.interface = volume_interface
 
         # Get volume as percentage (0.0 to 1.0)
         current_volume = volume_interface.GetMasterVolumeLevelScalar()
         return int(current_volume * 100)
     except Exception as e:
-        print(f"⚠ Error getting Windows volume: {e}")
+        log.warning("⚠ Error getting Windows volume: %s", e)
+        _windows_volume.interface = None  # Activate again on the next read (e.g. after a device swap)
         return None
 
 
+# Shared pulsectl client for volume reads (created on first use)
+_pulse = None
+_pulse_lock = threading.Lock()
+
+
+def get_volume_pulsectl():
+    """Get the default sink's volume through pulsectl (0-100)."""
+    global _pulse
+    with _pulse_lock:
+        try:
+            if _pulse is None:
+                _pulse = pulsectl.Pulse('qmk-keyboard-monitor')
+            sink = _pulse.get_sink_by_name(_pulse.server_info().default_sink_name)
+            return round(sink.volume.value_flat * 100)
+        except Exception as e:
+            log.warning("⚠ Error getting Linux volume with pulsectl: %s", e)
+            if _pulse is not None:
+                _pulse.close()
+                _pulse = None  # Reconnect on the next read (e.g. after a server restart)
+            return None
+
+
 def get_volume_linux():
     """Get system volume on Linux (0-100)."""
-    try:
-        # Try using pactl (PulseAudio)
-        result = subprocess.run(
-            ['pactl', 'get-sink-volume', '@DEFAULT_SINK@'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        # Parse output like "Volume: front-left: 65536 /  100% / 0.00 dB"
-        for line in result.stdout.split('\n'):
-            if 'Volume:' in line:
-                # Extract first percentage value
-                parts = line.split('%')[0].split()
-                volume = int(parts[-1])
-                return volume
-    except FileNotFoundError:
-        # Try using amixer as fallback
+    if pulsectl is not None:
+        return get_volume_pulsectl()
+    elif PACTL_PATH:
+        try:
+            # PulseAudio / PipeWire
+            result = subprocess.run(
+                [PACTL_PATH, 'get-sink-volume', '@DEFAULT_SINK@'],
+                capture_output=True,
+                check=True
+            )
+            # Parse output like "Volume: front-left: 65536 /  100% / 0.00 dB"
+            match = PACTL_VOLUME_RE.search(result.stdout)
+            if match:
+                return int(match.group(1))
+        except Exception as e:
+            log.warning("⚠ Error getting Linux volume with pactl: %s", e)
+            return None
+    else:
+        # No pactl, fall back to ALSA
         try:
             result = subprocess.run(
-                ['amixer', 'get', 'Master'],
+                [AMIXER_PATH or 'amixer', 'get', 'Master'],
                 capture_output=True,
-                text=True,
                 check=True
             )
             # Parse output like "[65%]"
-            for line in result.stdout.split('\n'):
-                if '[' in line and '%' in line:
-                    start = line.index('[') + 1
-                    end = line.index('%')
-                    volume = int(line[start:end])
-                    return volume
+            match = AMIXER_VOLUME_RE.search(result.stdout)
+            if match:
+                return int(match.group(1))
         except Exception as e:
-            print(f"⚠ Error getting Linux volume with amixer: {e}")
+            log.warning("⚠ Error getting Linux volume with amixer: %s", e)
             return None
-    except Exception as e:
-        print(f"⚠ Error getting Linux volume with pactl: {e}")
-        return None
 
 
-def get_system_volume():
-    """Get system volume based on the current platform (0-100)."""
-    system = platform.system()
+def get_volume_unsupported():
+    """Volume reader for platforms without a backend; always None."""
+    log.warning("⚠ Unsupported platform: %s", SYSTEM)
+    return None
 
-    if system == "Darwin":  # macOS
-        return get_volume_macos()
-    elif system == "Windows":
-        return get_volume_windows()
-    elif system == "Linux":
-        return get_volume_linux()
-    else:
-        print(f"⚠ Unsupported platform: {system}")
+
+# get_system_volume() returns the system volume (0-100) for the current
+# platform. It is polled every tick, so the backend is picked once here rather
+# than by comparing platform names on each call.
+get_system_volume = {
+    "Darwin": get_volume_macos,  # macOS
+    "Windows": get_volume_windows,
+    "Linux": get_volume_linux,
+}.get(SYSTEM, get_volume_unsupported)
+
+
+class PulsectlVolumeWatcher:
+    """Watches PulseAudio/PipeWire for sink changes through pulsectl's event API.
+
+    A dedicated client blocks in event_listen() on its own thread and puts
+    ('volume', None) on the events queue for every sink or server change.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.pulse = pulsectl.Pulse('qmk-keyboard-monitor-events')
+        self.pulse.event_mask_set('sink', 'server')
+        self.pulse.event_callback_set(self.on_event)
+        self.thread = threading.Thread(target=self.run, name='volume-watcher', daemon=True)
+        self.thread.start()
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+    def on_event(self, event):
+        self.events.put(('volume', None))
+
+    def run(self):
+        try:
+            self.pulse.event_listen()
+        except Exception as e:
+            log.warning("⚠ Stopped watching PulseAudio volume changes: %s", e)
+        finally:
+            self.pulse.close()
+
+    def stop(self):
+        # event_listen_stop() is a no-op if the loop isn't polling yet, so repeat it
+        for _ in range(10):
+            if not self.thread.is_alive():
+                break
+            self.pulse.event_listen_stop()
+            self.thread.join(0.1)
+
+
+class PactlVolumeWatcher:
+    """Watches PulseAudio/PipeWire for sink changes with `pactl subscribe`.
+
+    A single long-lived pactl process reports server events. Whenever a sink
+    or the default sink changes, ('volume', None) is put on the events queue,
+    so the main loop reads the volume right away instead of polling for it.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.process = subprocess.Popen(
+            [PACTL_PATH, 'subscribe'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.thread = threading.Thread(target=self.run, name='volume-watcher', daemon=True)
+        self.thread.start()
+
+    @property
+    def running(self):
+        return self.process.poll() is None
+
+    def run(self):
+        # Lines look like "Event 'change' on sink #0" or "Event 'change' on server #-1"
+        for line in self.process.stdout:
+            if b" on sink #" in line or b" on server" in line:
+                self.events.put(('volume', None))
+
+    def stop(self):
+        self.process.terminate()
+
+
+# CoreAudio (macOS) property listener API, used through ctypes
+def fourcc(code):
+    """Four-character code as used for CoreAudio selectors and scopes."""
+    return int.from_bytes(code.encode('ascii'), 'big')
+
+
+class AudioObjectPropertyAddress(ctypes.Structure):
+    _fields_ = [
+        ('mSelector', ctypes.c_uint32),
+        ('mScope', ctypes.c_uint32),
+        ('mElement', ctypes.c_uint32),
+    ]
+
+
+AudioObjectPropertyListenerProc = ctypes.CFUNCTYPE(
+    ctypes.c_int32,  # OSStatus
+    ctypes.c_uint32,  # AudioObjectID
+    ctypes.c_uint32,  # Number of addresses
+    ctypes.POINTER(AudioObjectPropertyAddress),
+    ctypes.c_void_p  # Client data
+)
+
+COREAUDIO_PATH = '/System/Library/Frameworks/CoreAudio.framework/CoreAudio'
+AUDIO_SYSTEM_OBJECT = 1  # kAudioObjectSystemObject
+DEFAULT_OUTPUT_DEVICE_ADDRESS = AudioObjectPropertyAddress(
+    fourcc('dOut'), fourcc('glob'), 0)  # kAudioHardwarePropertyDefaultOutputDevice
+# Output volume (main element and the two stereo channels, whichever the device has) and mute
+VOLUME_SCALAR_ADDRESSES = [
+    AudioObjectPropertyAddress(fourcc('volm'), fourcc('outp'), element)  # kAudioDevicePropertyVolumeScalar
+    for element in (0, 1, 2)
+]
+OUTPUT_VOLUME_ADDRESSES = VOLUME_SCALAR_ADDRESSES + [
+    AudioObjectPropertyAddress(fourcc('mute'), fourcc('outp'), 0)]  # kAudioDevicePropertyMute
+
+# CoreAudio framework with argument types set up (loaded on first use)
+_core_audio = None
+
+
+def load_core_audio():
+    """Load the CoreAudio framework, raising OSError where it doesn't exist."""
+    global _core_audio
+    if _core_audio is None:
+        core_audio = ctypes.CDLL(COREAUDIO_PATH)
+        for name in ('AudioObjectAddPropertyListener', 'AudioObjectRemovePropertyListener'):
+            function = getattr(core_audio, name)
+            function.argtypes = [ctypes.c_uint32, ctypes.POINTER(AudioObjectPropertyAddress),
+                                 AudioObjectPropertyListenerProc, ctypes.c_void_p]
+            function.restype = ctypes.c_int32
+        core_audio.AudioObjectGetPropertyData.argtypes = [
+            ctypes.c_uint32, ctypes.POINTER(AudioObjectPropertyAddress), ctypes.c_uint32,
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32), ctypes.c_void_p]
+        core_audio.AudioObjectGetPropertyData.restype = ctypes.c_int32
+        _core_audio = core_audio
+    return _core_audio
+
+
+def get_property(core_audio, object_id, address, value):
+    """Read a fixed-size CoreAudio property into the ctypes value. Returns True on success."""
+    size = ctypes.c_uint32(ctypes.sizeof(value))
+    status = core_audio.AudioObjectGetPropertyData(
+        object_id, ctypes.byref(address), 0, None, ctypes.byref(size), ctypes.byref(value))
+    return status == 0
+
+
+def default_output_device(core_audio):
+    """Return the default output device's AudioObjectID, or 0 if there is none."""
+    device_id = ctypes.c_uint32(0)
+    if not get_property(core_audio, AUDIO_SYSTEM_OBJECT, DEFAULT_OUTPUT_DEVICE_ADDRESS, device_id):
+        return 0
+    return device_id.value
+
+
+def get_volume_coreaudio():
+    """Read the default output device's volume through CoreAudio (0-100).
+
+    Uses the device's main volume, or the average of its stereo channels if it
+    only has per-channel volume. Returns None if CoreAudio can't tell.
+    """
+    try:
+        core_audio = load_core_audio()
+    except OSError:
+        return None
+
+    device_id = default_output_device(core_audio)
+    if not device_id:
         return None
 
+    channels = []
+    for address in VOLUME_SCALAR_ADDRESSES:
+        scalar = ctypes.c_float()
+        if get_property(core_audio, device_id, address, scalar):
+            if address.mElement == 0:
+                return round(scalar.value * 100)
+            channels.append(scalar.value)
+    if not channels:
+        return None
+    return round(sum(channels) / len(channels) * 100)
+
+
+class CoreAudioVolumeWatcher:
+    """Watches the default output device's volume with CoreAudio listeners (macOS).
+
+    CoreAudio calls the listener on its own notification thread when the
+    volume, mute state or default output device changes. ('volume', None) is
+    then put on the events queue, so the main loop reads the volume right away
+    instead of polling it every tick.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.running = True
+        self.lock = threading.Lock()
+        self.registered = []  # (object ID, address) pairs with our listener
+
+        self.core_audio = load_core_audio()
+
+        # Keep a reference, CoreAudio only holds the raw function pointer
+        self.listener = AudioObjectPropertyListenerProc(self.on_change)
+
+        with self.lock:
+            if not self.add_listener(AUDIO_SYSTEM_OBJECT, DEFAULT_OUTPUT_DEVICE_ADDRESS):
+                raise OSError("could not listen for default output device changes")
+            self.watch_default_device()
+
+    def add_listener(self, object_id, address):
+        status = self.core_audio.AudioObjectAddPropertyListener(
+            object_id, ctypes.byref(address), self.listener, None)
+        if status != 0:
+            return False  # e.g. the device has no such volume element
+        self.registered.append((object_id, address))
+        return True
+
+    def watch_default_device(self):
+        """(Re-)register the volume listeners on the current default output device."""
+        for object_id, address in self.registered[1:]:
+            self.core_audio.AudioObjectRemovePropertyListener(
+                object_id, ctypes.byref(address), self.listener, None)
+        del self.registered[1:]
+
+        device_id = default_output_device(self.core_audio)
+        if device_id:
+            for address in OUTPUT_VOLUME_ADDRESSES:
+                self.add_listener(device_id, address)
+
+    def on_change(self, object_id, address_count, addresses, client_data):
+        with self.lock:
+            if not self.running:
+                return 0
+            if object_id == AUDIO_SYSTEM_OBJECT:
+                # Default output device switched, follow it
+                self.watch_default_device()
+        self.events.put(('volume', None))
+        return 0
+
+    def stop(self):
+        with self.lock:
+            self.running = False
+            for object_id, address in self.registered:
+                self.core_audio.AudioObjectRemovePropertyListener(
+                    object_id, ctypes.byref(address), self.listener, None)
+            self.registered.clear()
+
+
+class WindowsVolumeWatcher:
+    """Watches the default speakers' volume with an IAudioEndpointVolumeCallback (Windows).
+
+    Windows calls OnNotify on one of its own threads whenever the endpoint's
+    volume or mute state changes, and ('volume', None) is put on the events
+    queue. A switch to another output device isn't reported; the main loop's
+    periodic re-check (VOLUME_RECHECK_INTERVAL) picks that up.
+    """
+
+    def __init__(self, events):
+        from ctypes import cast, POINTER
+        from comtypes import CLSCTX_ALL, COMObject
+        from pycaw.api.endpointvolume import IAudioEndpointVolumeCallback
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        class Callback(COMObject):
+            _com_interfaces_ = [IAudioEndpointVolumeCallback]
+
+            def OnNotify(self, notify):
+                events.put(('volume', None))
+
+        devices = AudioUtilities.GetSpeakers()
+        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        self.volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
+        self.callback = Callback()
+        self.volume_interface.RegisterControlChangeNotify(self.callback)
+        self.running = True
+
+    def stop(self):
+        if self.running:
+            self.running = False
+            self.volume_interface.UnregisterControlChangeNotify(self.callback)
+
+
+def start_volume_watcher(events):
+    """Start watching for volume change notifications, if the platform has them.
+
+    Returns the watcher, or None if the volume has to be polled every tick.
+    """
+    if SYSTEM == "Linux" and pulsectl is not None:
+        try:
+            return PulsectlVolumeWatcher(events)
+        except Exception as e:
+            log.warning("⚠ Could not watch PulseAudio volume changes: %s", e)
+            return None
+    elif SYSTEM == "Linux" and PACTL_PATH:
+        try:
+            return PactlVolumeWatcher(events)
+        except OSError:
+            return None
+    elif SYSTEM == "Darwin":
+        try:
+            return CoreAudioVolumeWatcher(events)
+        except OSError as e:
+            log.warning("⚠ Could not watch CoreAudio volume changes: %s", e)
+            return None
+    elif SYSTEM == "Windows":
+        try:
+            return WindowsVolumeWatcher(events)
+        except Exception as e:
+            log.warning("⚠ Could not watch Windows volume changes: %s", e)
+            return None
+    return None
+
 
 def get_media_macos():
     """Get currently playing media on macOS."""
@@ -610,95 +1169,168 @@ def get_media_linux():
         return None
 
 
+def media_display_text(media_text):
+    """Return the part of a media title the keyboard can show (None if empty).
+
+    The title is trimmed and cut to MEDIA_TEXT_MAX_BYTES of UTF-8 without
+    splitting a character. Change detection then compares short strings of
+    what is actually displayed, so titles that only differ past the cut-off
+    or in surrounding whitespace aren't resent.
+    """
+    if not media_text:
+        return None
+    text = media_text.strip().encode('utf-8')[:MEDIA_TEXT_MAX_BYTES].decode('utf-8', 'ignore')
+    return text or None
+
+
 def get_current_media():
-    """Get currently playing media based on platform."""
-    system = platform.system()
+    """Get currently playing media based on platform, as display text."""
+    system = SYSTEM
 
     if system == "Darwin":  # macOS
-        return get_media_macos()
+        media_text = get_media_macos()
     elif system == "Windows":
-        return get_media_windows()
+        media_text = get_media_windows()
     elif system == "Linux":
-        return get_media_linux()
+        media_text = get_media_linux()
     else:
-        return None
+        media_text = None
+
+    return media_display_text(media_text)
 
 
 # ============================================================================
 # HID COMMUNICATION
 # ============================================================================
 
+# Last HID enumeration result. Walking the OS HID tree (sysfs/udev, IOKit) is
+# comparatively expensive, so the once-a-second connection check reuses it
+# until it expires or something suggests the device list has changed.
+_enum_cache = {'time': 0.0, 'device': None}
+
+
+def enumerate_keyboard():
+    """Enumerate HID devices and return our keyboard's info dict, or None."""
+    found = None
+    # hidapi filters by VID/PID in C, so only our keyboard's interfaces come back
+    for device_info in hid.enumerate(VENDOR_ID, PRODUCT_ID):
+        if (device_info['usage_page'] == USAGE_PAGE and
+            device_info['usage'] == USAGE):
+            found = device_info
+            break
+
+    _enum_cache['time'] = time.time()
+    _enum_cache['device'] = found
+    return found
+
+
+# Set when a hidraw device is added or removed, so a pending reconnect can
+# skip the rest of its back-off delay
+hotplug_event = threading.Event()
+
+
+def invalidate_enumeration(*_):
+    """Force the next connection check to re-enumerate HID devices."""
+    _enum_cache['time'] = 0.0
+
+
+def on_hotplug(udev_device):
+    """pyudev callback for hidraw add/remove events."""
+    invalidate_enumeration()
+    hotplug_event.set()
+
+
+def start_hotplug_monitor():
+    """Invalidate the enumeration cache on hidraw add/remove events (Linux + pyudev).
+
+    Returns the observer, or None if hotplug events aren't available.
+    """
+    if pyudev is None or SYSTEM != "Linux":
+        return None
+
+    try:
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem='hidraw')
+        observer = pyudev.MonitorObserver(monitor, callback=on_hotplug, name='hotplug')
+        observer.daemon = True
+        observer.start()
+        return observer
+    except Exception as e:
+        log.warning("⚠ Could not watch for USB hotplug events: %s", e)
+        return None
+
+
 def find_keyboard_device(silent=False):
     """Find the keyboard HID device. Set silent=True to suppress output."""
     if not silent:
-        print(f"🔍 Looking for keyboard (VID: 0x{VENDOR_ID:04X}, PID: 0x{PRODUCT_ID:04X})...")
+        log.info("🔍 Looking for keyboard (VID: 0x%04X, PID: 0x%04X)...", VENDOR_ID, PRODUCT_ID)
 
-    # List all HID devices
-    devices = hid.enumerate()
+    # Always enumerate afresh when connecting
+    device_info = enumerate_keyboard()
+    if device_info is None:
+        return None
 
-    # Find our keyboard by VID/PID and usage page
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
+    if not silent:
+        log.info("✓ Found keyboard: %s", device_info['product_string'])
+    return device_info['path']
 
-            if not silent:
-                print(f"✓ Found keyboard: {device_info['product_string']}")
-            return device_info['path']
 
-    return None
+def write_packet(device, packet, name):
+    """Write a Raw HID report to the keyboard.
 
+    The report is passed to hidapi as-is, so callers build it directly as a
+    bytearray of HID_PACKET_SIZE + 1 bytes with the report ID (0) in byte 0
+    instead of converting a packet to a list of ints on every send.
 
-def send_volume_update(device, volume):
-    """Send volume update to keyboard via Raw HID."""
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_VOLUME_UPDATE  # Command ID
-    packet[1] = volume             # Volume level (0-100)
+    Args:
+        device: HID device handle
+        packet: Report buffer (report ID followed by the 32-byte packet)
+        name: Packet name used in error messages
 
+    Returns:
+        True on success, False on failure
+    """
     try:
-        # Send the packet (first byte is report ID, usually 0)
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(packet)
 
         # Check if write was successful
         if bytes_written <= 0:
-            print(f"✗ Write failed: {bytes_written} bytes written")
+            log.error("✗ %s write failed: %d bytes written", name, bytes_written)
+            invalidate_enumeration()
             return False
 
         return True
     except Exception as e:
-        print(f"✗ Error sending HID packet: {e}")
+        log.error("✗ Error sending %s packet: %s", name, e)
+        invalidate_enumeration()
         return False
 
 
+def send_volume_update(device, volume):
+    """Send volume update to keyboard via Raw HID."""
+    # Create HID report (report ID 0 + 32-byte packet)
+    packet = bytearray(HID_PACKET_SIZE + 1)
+    packet[1] = CMD_VOLUME_UPDATE  # Command ID
+    packet[2] = volume             # Volume level (0-100)
+
+    return write_packet(device, packet, "Volume")
+
+
 def send_media_update(device, media_text):
     """Send media text update to keyboard via Raw HID."""
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_MEDIA_UPDATE  # Command ID
+    # Create HID report (report ID 0 + 32-byte packet)
+    packet = bytearray(HID_PACKET_SIZE + 1)
+    packet[1] = CMD_MEDIA_UPDATE  # Command ID
 
-    # Encode media text (max 30 chars + null terminator)
+    # Encode media text (max 30 bytes + null terminator)
     if media_text:
-        media_bytes = media_text.encode('utf-8')[:30]  # Limit to 30 chars
-        packet[1:1+len(media_bytes)] = media_bytes
-        packet[1+len(media_bytes)] = 0  # Null terminator
+        media_bytes = media_text.encode('utf-8')[:MEDIA_TEXT_MAX_BYTES]
+        packet[2:2+len(media_bytes)] = media_bytes
+        packet[2+len(media_bytes)] = 0  # Null terminator
     else:
-        packet[1] = 0  # Empty string
-
-    try:
-        # Send the packet
-        bytes_written = device.write([0] + list(packet))
-
-        # Check if write was successful
-        if bytes_written <= 0:
-            print(f"✗ Media write failed: {bytes_written} bytes written")
-            return False
+        packet[2] = 0  # Empty string
 
-        return True
-    except Exception as e:
-        print(f"✗ Error sending media packet: {e}")
-        return False
+    return write_packet(device, packet, "Media")
 
 
 def send_datetime_update(device, override_datetime=None):
@@ -708,35 +1340,23 @@ def send_datetime_update(device, override_datetime=None):
         device: HID device handle
         override_datetime: Optional datetime object to send instead of current time (for testing)
     """
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_DATETIME_UPDATE  # Command ID
+    # Create HID report (report ID 0 + 32-byte packet)
+    packet = bytearray(HID_PACKET_SIZE + 1)
+    packet[1] = CMD_DATETIME_UPDATE  # Command ID
 
     # Get current date/time or use override
     now = override_datetime if override_datetime else datetime.now()
 
     # Pack date/time: year (2 bytes), month, day, hour, minute, second
-    packet[1] = now.year & 0xFF  # Year low byte
-    packet[2] = (now.year >> 8) & 0xFF  # Year high byte
-    packet[3] = now.month
-    packet[4] = now.day
-    packet[5] = now.hour
-    packet[6] = now.minute
-    packet[7] = now.second
-
-    try:
-        # Send the packet
-        bytes_written = device.write([0] + list(packet))
-
-        # Check if write was successful
-        if bytes_written <= 0:
-            print(f"✗ DateTime write failed: {bytes_written} bytes written")
-            return False
+    packet[2] = now.year & 0xFF  # Year low byte
+    packet[3] = (now.year >> 8) & 0xFF  # Year high byte
+    packet[4] = now.month
+    packet[5] = now.day
+    packet[6] = now.hour
+    packet[7] = now.minute
+    packet[8] = now.second
 
-        return True
-    except Exception as e:
-        print(f"✗ Error sending datetime packet: {e}")
-        return False
+    return write_packet(device, packet, "DateTime")
 
 
 def send_weather_update(device, weather_state):
@@ -752,24 +1372,12 @@ def send_weather_update(device, weather_state):
     Returns:
         True on success, False on failure
     """
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_WEATHER_UPDATE  # Command ID (0x04)
-    packet[1] = weather_state        # Weather state (0-8)
+    # Create HID report (report ID 0 + 32-byte packet)
+    packet = bytearray(HID_PACKET_SIZE + 1)
+    packet[1] = CMD_WEATHER_UPDATE  # Command ID (0x04)
+    packet[2] = weather_state        # Weather state (0-8)
 
-    try:
-        # Send the packet
-        bytes_written = device.write([0] + list(packet))
-
-        # Check if write was successful
-        if bytes_written <= 0:
-            print(f"✗ Weather write failed: {bytes_written} bytes written")
-            return False
-
-        return True
-    except Exception as e:
-        print(f"✗ Error sending weather packet: {e}")
-        return False
+    return write_packet(device, packet, "Weather")
 
 
 def send_wind_update(device, wind_intensity, wind_direction):
@@ -783,78 +1391,74 @@ def send_wind_update(device, wind_intensity, wind_direction):
     Returns:
         True on success, False on failure
     """
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_WIND_UPDATE  # Command ID (0x05)
-    packet[1] = wind_intensity    # Wind intensity (0-3)
-    packet[2] = wind_direction    # Wind direction (0-1)
+    # Create HID report (report ID 0 + 32-byte packet)
+    packet = bytearray(HID_PACKET_SIZE + 1)
+    packet[1] = CMD_WIND_UPDATE  # Command ID (0x05)
+    packet[2] = wind_intensity    # Wind intensity (0-3)
+    packet[3] = wind_direction    # Wind direction (0-1)
 
-    try:
-        # Send the packet
-        bytes_written = device.write([0] + list(packet))
+    return write_packet(device, packet, "Wind")
 
-        # Check if write was successful
-        if bytes_written <= 0:
-            print(f"✗ Wind write failed: {bytes_written} bytes written")
-            return False
 
-        return True
-    except Exception as e:
-        print(f"✗ Error sending wind packet: {e}")
-        return False
+# Game messages reuse one report buffer instead of allocating one per send.
+# Only the main thread writes to the keyboard, so sharing it is safe.
+_game_report = bytearray(HID_PACKET_SIZE + 1)
+_zero_packet = memoryview(bytes(HID_PACKET_SIZE))
+
+
+def game_report(msg_type):
+    """Return the shared game report, cleared and tagged with msg_type."""
+    _game_report[1:] = _zero_packet
+    _game_report[1] = msg_type
+    return _game_report
 
 
 def send_enter_name(device, rank):
     """Send ENTER_NAME message to keyboard"""
-    data = bytearray(HID_PACKET_SIZE)
-    data[0] = MSG_ENTER_NAME
-    data[1] = rank
+    data = game_report(MSG_ENTER_NAME)
+    data[2] = rank
 
-    try:
-        bytes_written = device.write([0] + list(data))
-        if bytes_written <= 0:
-            print(f"✗ Enter name write failed")
-            return False
-        print(f"🎮 Sent ENTER_NAME (rank: {rank + 1})")
-        return True
-    except Exception as e:
-        print(f"✗ Error sending ENTER_NAME: {e}")
+    if not write_packet(device, data, "ENTER_NAME"):
         return False
+    log.info("🎮 Sent ENTER_NAME (rank: %d)", rank + 1)
+    return True
 
 
 def send_show_scores(device, scores):
-    """Send SHOW_SCORES message with top 10 list"""
-    data = bytearray(HID_PACKET_SIZE)
-    data[0] = MSG_SHOW_SCORES
-
-    # Pack up to 10 scores (each: 3 chars + 2 bytes score = 5 bytes)
-    offset = 1
-    for i, entry in enumerate(scores[:10]):
-        if offset + 5 > 32:
-            break  # Max 6 scores per packet (1 + 6*5 = 31 bytes)
-
-        # Encode name (3 chars)
-        name = entry['name'][:3].ljust(3)
-        for c in name:
-            data[offset] = ord(c)
-            offset += 1
-
-        # Encode score (2 bytes, big-endian)
-        score = min(entry['score'], 65535)
-        data[offset] = (score >> 8) & 0xFF
-        data[offset + 1] = score & 0xFF
-        offset += 2
+    """Send SHOW_SCORES messages with the top 10 list.
 
-    try:
-        bytes_written = device.write([0] + list(data))
-        if bytes_written <= 0:
-            print(f"✗ Show scores write failed")
+    A packet holds at most SHOW_SCORES_PER_PACKET entries, so the list is
+    split across several packets, each starting with the index of its first
+    entry and its entry count. The keyboard starts a new list at index 0.
+    """
+    scores = scores[:10]
+    data = game_report(MSG_SHOW_SCORES)
+
+    start = 0
+    while True:
+        batch = scores[start:start + SHOW_SCORES_PER_PACKET]
+        data[2] = start
+        data[3] = len(batch)
+        data[4:] = _zero_packet[3:]
+
+        offset = 4
+        for entry in batch:
+            SHOW_SCORES_ENTRY_FORMAT.pack_into(
+                data, offset,
+                entry['name'][:3].ljust(3).encode('latin-1', 'replace'),
+                min(entry['score'], 65535)
+            )
+            offset += SHOW_SCORES_ENTRY_FORMAT.size
+
+        if not write_packet(device, data, "SHOW_SCORES"):
             return False
-        print(f"🎮 Sent SHOW_SCORES ({len(scores)} entries)")
-        return True
-    except Exception as e:
-        print(f"✗ Error sending SHOW_SCORES: {e}")
-        return False
+
+        start += SHOW_SCORES_PER_PACKET
+        if start >= len(scores):
+            break
+
+    log.info("🎮 Sent SHOW_SCORES (%d entries)", len(scores))
+    return True
 
 
 def process_game_message(device, data, score_manager):
@@ -863,36 +1467,37 @@ def process_game_message(device, data, score_manager):
         return True
 
     msg_type = data[0]
+    report = bytes(data)
 
     if msg_type == MSG_SCORE_SUBMIT:
         # Parse score (2 bytes, big-endian)
-        score = (data[1] << 8) | data[2]
-        print(f"\n{'=' * 50}")
-        print(f"🎮 Score Received: {score}")
-        print(f"{'=' * 50}")
+        score, = SCORE_SUBMIT_FORMAT.unpack_from(report)
+        log.info("\n" + "=" * 50)
+        log.info("🎮 Score Received: %d", score)
+        log.info("=" * 50)
 
         # Check if it makes top 10
         rank = score_manager.check_score(score)
 
         if rank >= 0:
-            print(f"🏆 NEW HIGH SCORE! Rank: {rank + 1}")
+            log.info("🏆 NEW HIGH SCORE! Rank: %d", rank + 1)
             return send_enter_name(device, rank)
         else:
-            print("📊 Score didn't make top 10")
+            log.info("📊 Score didn't make top 10")
             return send_show_scores(device, score_manager.scores)
 
     elif msg_type == MSG_NAME_SUBMIT:
         # Parse name (3 chars) and score (2 bytes)
-        name = ''.join(chr(data[i]) for i in range(1, 4))
-        score = (data[4] << 8) | data[5]
-        print(f"\n{'=' * 50}")
-        print(f"🎮 Name Submitted: {name} - {score}")
-        print(f"{'=' * 50}")
+        name_bytes, score = NAME_SUBMIT_FORMAT.unpack_from(report)
+        name = name_bytes.decode('latin-1')
+        log.info("\n" + "=" * 50)
+        log.info("🎮 Name Submitted: %s - %d", name, score)
+        log.info("=" * 50)
 
         # Add to scores
         rank = score_manager.add_score(name, score)
         if rank >= 0:
-            print(f"💾 Added to high scores at rank {rank + 1}")
+            log.info("💾 Added to high scores at rank %d", rank + 1)
             score_manager.print_scores()
 
         # Send updated scores
@@ -902,15 +1507,10 @@ def process_game_message(device, data, score_manager):
 
 
 def is_keyboard_connected():
-    """Check if keyboard is still in HID device list."""
-    devices = hid.enumerate()
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
-            return True
-    return False
+    """Check if keyboard is still in HID device list (cached for ENUMERATE_CACHE_TTL)."""
+    if time.time() - _enum_cache['time'] < ENUMERATE_CACHE_TTL:
+        return _enum_cache['device'] is not None
+    return enumerate_keyboard() is not None
 
 
 def connect_to_keyboard(silent=False):
@@ -922,39 +1522,221 @@ def connect_to_keyboard(silent=False):
     try:
         device = hid.device()
         device.open_path(device_path)
-        return device
     except Exception as e:
         if not silent:
-            print(f"⚠ Error opening HID device: {e}")
+            log.warning("⚠ Error opening HID device: %s", e)
         return None
 
+    # hidapi's hidraw backend hands out the /dev/hidrawN node as the path
+    if SYSTEM == 'Linux' and os.fsdecode(device_path).startswith('/dev/hidraw'):
+        try:
+            return HidrawDevice(device, device_path)
+        except OSError as e:
+            log.debug("Writing through hidapi, can't open %s: %s", os.fsdecode(device_path), e)
+    return device
+
+
+class HidrawDevice(HidrawWriter):
+    """An open hidapi device whose reports are written straight to its hidraw node.
+
+    Writes go through HidrawWriter on a second descriptor for the same
+    /dev/hidrawN node; reads and closing still go through hidapi.
+    """
+
+    def __init__(self, device, path):
+        super().__init__(path)
+        self.device = device
+
+    def read(self, size, timeout_ms=0):
+        return self.device.read(size, timeout_ms=timeout_ms)
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self.device.close()
+
+
+class HIDReader:
+    """Reads reports from the keyboard on a background thread.
+
+    Each report is put on the events queue as ('report', data), so the main
+    loop handles game messages as soon as they arrive while it waits on the
+    queue, rather than polling the device between its other work. The first
+    read error after a good read is reported as ('read_error', None), so the
+    main loop checks the connection right away.
+    """
+
+    def __init__(self, device, events):
+        self.device = device
+        self.events = events
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='hid-reader', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        failing = False
+        while not self.stopping.is_set():
+            try:
+                data = self.device.read(HID_PACKET_SIZE, timeout_ms=int(HID_READ_TIMEOUT * 1000))
+            except Exception:
+                # Read error doesn't necessarily mean disconnection, have the
+                # main loop re-enumerate to find out
+                if not failing:
+                    failing = True
+                    invalidate_enumeration()
+                    self.events.put(('read_error', None))
+                self.stopping.wait(POLL_INTERVAL)
+                continue
+
+            failing = False
+            if data:
+                self.events.put(('report', data))
+
+    def stop(self):
+        """Stop reading. Must be called before the device is closed.
+
+        Returns False if the thread is still inside a read after the timeout,
+        in which case the device must not be closed.
+        """
+        self.stopping.set()
+        self.thread.join(HID_READ_TIMEOUT + 1.0)
+        return not self.thread.is_alive()
+
+
+def close_keyboard(device, reader):
+    """Stop the reader, then close the device.
+
+    hidapi must not close a device while another thread is reading it, so if
+    the reader doesn't stop in time the handle is left open (leaked) instead.
+    """
+    if reader is not None and not reader.stop():
+        log.warning("⚠ HID reader did not stop, leaving the device handle open")
+        return
+    try:
+        device.close()
+    except:
+        pass
+
+
+def disconnect_keyboard(device, reader):
+    """Close a (possibly dead) device handle and forget what it was showing.
+
+    Returns (device, reader, sent) for the main loop to assign: None, None
+    and an empty Snapshot, so everything is synced again after reconnecting.
+    """
+    log.info("⏳ Waiting for keyboard to reconnect...\n")
+    close_keyboard(device, reader)
+    return None, None, Snapshot()
+
+
+# ============================================================================
+# DISPLAY STATE
+# ============================================================================
+
+@dataclass
+class Snapshot:
+    """Values shown on the keyboard display (None = unknown, sent on next sync)."""
+    volume: Optional[int] = None
+    media: Optional[str] = None
+    weather: Optional[int] = None
+    wind_intensity: Optional[int] = None
+    wind_direction: Optional[int] = None
+
+
+def push_changes(device, current, sent, syncing=False):
+    """Send the fields of `current` that differ from `sent` to the keyboard.
+
+    Args:
+        device: HID device handle
+        current: Snapshot of the freshly polled values
+        sent: Snapshot of what the keyboard shows, updated in place after each successful write
+        syncing: True for the initial sync after (re)connecting (only affects the log messages)
+
+    Returns:
+        True if every changed value was sent, False on the first failed write
+    """
+    if current.volume is not None and current.volume != sent.volume:
+        if syncing:
+            log.info("🔊 Syncing volume: %d%%", current.volume)
+        else:
+            # Every volume key press lands here, so only shown with --verbose
+            log.debug("🔊 Volume changed: %d%%", current.volume)
+        if not send_volume_update(device, current.volume):
+            log.error("✗ Volume send failed, keyboard may be disconnected")
+            return False
+        sent.volume = current.volume
+
+    if current.media != sent.media:
+        if current.media:
+            if syncing:
+                log.info("♪ Syncing media: %s", current.media)
+            else:
+                log.info("♪ Now playing: %s", current.media)
+        else:
+            log.info("♪ Playback stopped")
+        if not send_media_update(device, current.media if current.media else ""):
+            log.error("✗ Media send failed, keyboard may be disconnected")
+            return False
+        sent.media = current.media
+
+    if current.weather is not None and current.weather != sent.weather:
+        weather_name = WEATHER_NAMES.get(current.weather, 'Unknown')
+        if syncing:
+            log.info("🌤️  Syncing weather: %s", weather_name)
+        else:
+            log.info("🌤️  Weather changed: %s", weather_name)
+        if not send_weather_update(device, current.weather):
+            log.error("✗ Weather send failed, keyboard may be disconnected")
+            return False
+        sent.weather = current.weather
+
+    if (current.wind_intensity is not None and current.wind_direction is not None and
+        (current.wind_intensity, current.wind_direction) != (sent.wind_intensity, sent.wind_direction)):
+        wind_name = f"{WIND_INTENSITY_NAMES.get(current.wind_intensity, 'Unknown')} {WIND_DIRECTION_NAMES.get(current.wind_direction, 'Unknown')}"
+        if syncing:
+            log.info("💨 Syncing wind: %s", wind_name)
+        else:
+            log.info("💨 Wind changed: %s", wind_name)
+        if not send_wind_update(device, current.wind_intensity, current.wind_direction):
+            log.error("✗ Wind send failed, keyboard may be disconnected")
+            return False
+        sent.wind_intensity = current.wind_intensity
+        sent.wind_direction = current.wind_direction
+
+    return True
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# Season per month (index 0 unused) and time-of-day name per hour
+_SEASON_BY_MONTH = (
+    None,
+    "Winter", "Winter",
+    "Spring", "Spring", "Spring",
+    "Summer", "Summer", "Summer",
+    "Fall", "Fall", "Fall",
+    "Winter",
+)
+_TIME_OF_DAY_BY_HOUR = (
+    ("Night",) * 5      # 00-04
+    + ("Morning",) * 7  # 05-11
+    + ("Day",) * 6      # 12-17
+    + ("Evening",) * 4  # 18-21
+    + ("Night",) * 2    # 22-23
+)
+
+
 def get_season_name(month):
     """Get season name from month number."""
-    if month in [12, 1, 2]:
-        return "Winter"
-    elif month in [3, 4, 5]:
-        return "Spring"
-    elif month in [6, 7, 8]:
-        return "Summer"
-    else:
-        return "Fall"
+    return _SEASON_BY_MONTH[month]
 
 
 def get_time_of_day_name(hour):
     """Get time of day name from hour."""
-    if 5 <= hour < 12:
-        return "Morning"
-    elif 12 <= hour < 18:
-        return "Day"
-    elif 18 <= hour < 22:
-        return "Evening"
-    else:
-        return "Night"
+    return _TIME_OF_DAY_BY_HOUR[hour]
 
 
 def parse_test_datetime(datetime_str):
@@ -976,6 +1758,26 @@ def parse_test_datetime(datetime_str):
 # MAIN LOOP
 # ============================================================================
 
+def setup_logging(level=logging.INFO):
+    """Print log messages at `level` and above to stdout from a background thread.
+
+    Records are put on a queue and written by a QueueListener, so formatting
+    and slow terminal/journal writes stay off the monitoring loop. The
+    listener is stopped (flushing pending messages) at exit.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(level)
+    log.propagate = False
+
+    listener.start()
+    atexit.register(listener.stop)
+
+
 def main():
     """Main loop: monitor volume/media, send datetime, handle game messages."""
     # Parse command-line arguments
@@ -1005,6 +1807,9 @@ Examples:
   # Test summer day (July 20th at 2 PM)
   python3 keyboard_monitor.py --test-date "2025-07-20 14:00"
 
+  # Also log every volume change
+  python3 keyboard_monitor.py -v
+
 Features:
   • Monitors system volume and sends to keyboard display
   • Tracks media playback (Music/Spotify on macOS)
@@ -1045,19 +1850,36 @@ Features:
         type=int,
         default=600,
         metavar='SECONDS',
-        help='Weather update interval in seconds (default: 600 = 10 minutes)'
+        help='Weather update interval in seconds (default: 600 = 10 minutes). Backs off up to hourly while the weather is unchanged.'
     )
     parser.add_argument(
         '--no-weather',
         action='store_true',
         help='Disable weather monitoring (weather is enabled by default with Otterndorf, Germany)'
     )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        '-v', '--verbose',
+        action='store_const',
+        const=logging.DEBUG,
+        dest='log_level',
+        help='Also log every volume change and other details'
+    )
+    verbosity.add_argument(
+        '-q', '--quiet',
+        action='store_const',
+        const=logging.WARNING,
+        dest='log_level',
+        help='Only log warnings and errors'
+    )
+    parser.set_defaults(log_level=logging.INFO)
     args = parser.parse_args()
+    setup_logging(args.log_level)
 
-    print("=" * 60)
-    print("    QMK KEYBOARD COMPANION")
-    print("    Volume/Media/Weather Monitor + High Score Manager")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info("    QMK KEYBOARD COMPANION")
+    log.info("    Volume/Media/Weather Monitor + High Score Manager")
+    log.info("=" * 60)
 
     # Validate weather configuration
     # Weather is enabled by default with default location unless --no-weather is specified
@@ -1078,400 +1900,297 @@ Features:
         using_default = False
 
     if weather_enabled:
-        print(f"\n🌤️  WEATHER: Enabled")
+        log.info("\n🌤️  WEATHER: Enabled")
         if weather_latitude is not None and weather_longitude is not None:
             location_str = f"{weather_latitude}, {weather_longitude}"
             if using_default:
                 location_str += f" ({DEFAULT_WEATHER_LOCATION})"
-            print(f"   Location: {location_str}")
-            print(f"   API: Open-Meteo (primary)")
+            log.info("   Location: %s", location_str)
+            log.info("   API: Open-Meteo (primary)")
         if weather_location and not (weather_latitude and weather_longitude):
-            print(f"   Location: {weather_location}")
-            print(f"   API: wttr.in (primary)")
-        print(f"   Update interval: {args.weather_interval} seconds ({args.weather_interval // 60} minutes)")
+            log.info("   Location: %s", weather_location)
+            log.info("   API: wttr.in (primary)")
+        log.info("   Update interval: %d seconds (%d minutes)", args.weather_interval, args.weather_interval // 60)
     else:
-        print(f"\n🌤️  WEATHER: Disabled (use --weather-location or remove --no-weather to enable)")
+        log.info("\n🌤️  WEATHER: Disabled (use --weather-location or remove --no-weather to enable)")
 
     if args.test_date:
-        print(f"\n🧪 TEST MODE: Using override date/time")
-        print(f"   {args.test_date.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   Season: {get_season_name(args.test_date.month)}")
-        print(f"   Time: {get_time_of_day_name(args.test_date.hour)}")
+        log.info("\n🧪 TEST MODE: Using override date/time")
+        log.info("   %s", args.test_date.strftime('%Y-%m-%d %H:%M:%S'))
+        log.info("   Season: %s", get_season_name(args.test_date.month))
+        log.info("   Time: %s", get_time_of_day_name(args.test_date.hour))
 
-    print("\n⏳ Waiting for keyboard... (Press Ctrl+C to quit)\n")
+    log.info("\n⏳ Waiting for keyboard... (Press Ctrl+C to quit)\n")
 
     # Initialize high score manager
     score_manager = HighScoreManager()
     score_manager.print_scores()
 
     device = None
-    last_volume = None
-    last_media = None
-    last_weather = None  # Last weather state sent
-    last_wind_intensity = None  # Last wind intensity sent
-    last_wind_direction = None  # Last wind direction sent
-    reconnect_delay = 2.0  # Wait 2 seconds between reconnection attempts
-    last_connect_attempt = 0
+    reader = None  # HIDReader for the connected device
+    events = queue.Queue()  # ('report', data) and ('read_error', None) from the reader thread,
+                            # ('volume', None) from the watcher, ('weather', None) when a
+                            # background weather fetch finishes
+    sent = Snapshot()  # What the keyboard is currently showing
+    reconnect_delay = RECONNECT_DELAY  # Grows while the keyboard stays unplugged
+    next_connect_attempt = 0
     first_connection = True  # Track if this is the first connection
-    connection_check_interval = 1.0  # Check connection every second
-    last_connection_check = 0
-    last_media_check = 0  # Last time we checked media
-    last_datetime_update = 0  # Last time we sent date/time
-    last_weather_check = 0  # Last time we checked weather
+    last_connection_check = float('-inf')
+    volume_watcher = start_volume_watcher(events)
+    volume_changed = False  # Set by a volume change notification
+    last_volume_check = float('-inf')
+    pending_volume = None  # Volume waiting for VOLUME_DEBOUNCE before it is sent
+    pending_volume_start = 0  # When the current burst of volume changes started
+    pending_volume_time = 0  # When pending_volume was last seen changing
+    last_media_check = float('-inf')  # Last time we checked media
+    next_datetime_update = 0  # When the next minute starts (time to send date/time)
+    sent_minute = None  # Date/time last sent, truncated to the minute
+    last_weather_check = float('-inf')  # Last time we checked weather
+    weather_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='weather')
+    hotplug_observer = start_hotplug_monitor()
+    weather_fetch = None  # Pending background weather fetch (Future)
+    weather_interval = args.weather_interval  # Doubles (up to 8x) while the weather stays the same
+    weather_unchanged_count = 0
+    last_weather_result = None
 
     try:
         while True:
-            current_time = time.time()
+            # All scheduling below runs on the monotonic clock, so wall clock
+            # adjustments (NTP, manual changes) can't stall or bunch up the checks
+            current_time = time.monotonic()
 
             # Try to connect/reconnect if not connected
             if device is None:
-                # Only attempt reconnect every reconnect_delay seconds
-                if current_time - last_connect_attempt >= reconnect_delay:
-                    last_connect_attempt = current_time
+                # Only attempt reconnect once the back-off delay has passed, or
+                # right away when a HID device was just plugged in
+                if current_time >= next_connect_attempt or hotplug_event.is_set():
+                    hotplug_event.clear()
                     # Be quiet during reconnection attempts, verbose on first connect
                     device = connect_to_keyboard(silent=not first_connection)
 
-                    if device is not None:
+                    if device is None:
+                        next_connect_attempt = current_time + reconnect_delay
+                        reconnect_delay = min(reconnect_delay * 1.5, RECONNECT_MAX_DELAY)
+                    else:
+                        reconnect_delay = RECONNECT_DELAY
                         if first_connection:
-                            print(f"✓ Connected to keyboard!")
+                            log.info("✓ Connected to keyboard!")
                             first_connection = False
                         else:
-                            print(f"✓ Keyboard reconnected!")
-                        print("📊 Monitoring system volume + game scores...\n")
+                            log.info("✓ Keyboard reconnected!")
+                        log.info("📊 Monitoring system volume + game scores...\n")
+                        # Drop events queued while disconnected, everything is re-read below
+                        while not events.empty():
+                            events.get_nowait()
+                        reader = HIDReader(device, events)
 
                         # Reset connection check timer to check immediately
                         last_connection_check = current_time
 
-                        # Immediately send current volume on (re)connect
-                        current_volume = get_system_volume()
-                        if current_volume is not None:
-                            print(f"🔊 Syncing volume: {current_volume}%")
-                            if send_volume_update(device, current_volume):
-                                last_volume = current_volume
-                            else:
-                                # Send failed immediately after connect
-                                print("✗ Initial sync failed")
-                                print("⏳ Waiting for keyboard to reconnect...\n")
-                                try:
-                                    device.close()
-                                except:
-                                    pass
-                                device = None
-                                last_volume = None
-                                last_media = None
-                                last_weather = None
-                                last_wind_intensity = None
-                                last_wind_direction = None
-                                continue
-                        else:
-                            # Reset last_volume to force update on next successful read
-                            last_volume = None
-
-                        # Immediately send current media on (re)connect
-                        current_media = get_current_media()
-                        if current_media:
-                            print(f"♪ Syncing media: {current_media}")
-                            send_media_update(device, current_media)
-                            last_media = current_media
-                        else:
-                            last_media = None
+                        # Take one full snapshot and sync it all on (re)connect. Media and
+                        # weather are read in parallel so a slow weather fetch doesn't add
+                        # to the osascript/pactl calls; the volume is read here because the
+                        # Windows endpoint is a COM object owned by this thread.
+                        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='sync') as sync_executor:
+                            media_read = sync_executor.submit(get_current_media)
+                            weather_read = None
+                            if weather_enabled:
+                                weather_read = sync_executor.submit(
+                                    get_current_weather,
+                                    location=weather_location,
+                                    latitude=weather_latitude,
+                                    longitude=weather_longitude,
+                                    max_age=WEATHER_CACHE_MAX_AGE
+                                )
+                            current = Snapshot(volume=get_system_volume(), media=media_read.result())
+                            if weather_read is not None:
+                                current.weather, current.wind_intensity, current.wind_direction = weather_read.result()
+                        pending_volume = None
+                        last_media_check = current_time
+
+                        if weather_enabled:
+                            last_weather_check = current_time
+                            if current.weather is None:
+                                log.warning("⚠ Weather fetch failed")
+
+                        if not push_changes(device, current, sent, syncing=True):
+                            # Send failed immediately after connect
+                            log.error("✗ Initial sync failed")
+                            device, reader, sent = disconnect_keyboard(device, reader)
+                            continue
 
                         # Immediately send current date/time on (re)connect
                         dt_to_send = args.test_date if args.test_date else datetime.now()
-                        print(f"📅 Syncing date/time: {dt_to_send.strftime('%Y-%m-%d %H:%M:%S')}")
+                        log.info("📅 Syncing date/time: %s", dt_to_send.strftime('%Y-%m-%d %H:%M:%S'))
                         if send_datetime_update(device, dt_to_send):
-                            last_datetime_update = current_time
+                            sent_minute = dt_to_send.replace(second=0, microsecond=0)
+                            next_datetime_update = current_time + DATETIME_UPDATE_INTERVAL - (
+                                dt_to_send.second + dt_to_send.microsecond / 1e6)
                         else:
-                            print("✗ DateTime sync failed")
+                            log.error("✗ DateTime sync failed")
 
-                        # Immediately send current weather and wind on (re)connect if enabled
-                        if weather_enabled:
-                            weather_data = get_current_weather(
-                                location=weather_location,
-                                latitude=weather_latitude,
-                                longitude=weather_longitude
-                            )
-                            current_weather, current_wind_intensity, current_wind_direction = weather_data
-
-                            if current_weather is not None:
-                                weather_names = {
-                                    WEATHER_SUNNY: "Sunny",
-                                    WEATHER_RAIN_LIGHT: "Light Rain",
-                                    WEATHER_RAIN_MEDIUM: "Rain",
-                                    WEATHER_RAIN_HEAVY: "Heavy Rain",
-                                    WEATHER_SNOW_LIGHT: "Light Snow",
-                                    WEATHER_SNOW_MEDIUM: "Snow",
-                                    WEATHER_SNOW_HEAVY: "Heavy Snow",
-                                    WEATHER_CLOUDY: "Partly Cloudy",
-                                    WEATHER_OVERCAST: "Overcast"
-                                }
-                                print(f"🌤️  Syncing weather: {weather_names.get(current_weather, 'Unknown')}")
-                                if send_weather_update(device, current_weather):
-                                    last_weather = current_weather
-                                    last_weather_check = current_time
-                                else:
-                                    print("✗ Weather sync failed")
-
-                                # Send wind update if available
-                                if current_wind_intensity is not None and current_wind_direction is not None:
-                                    wind_intensity_names = {
-                                        WIND_NONE: "None",
-                                        WIND_LIGHT: "Light",
-                                        WIND_MEDIUM: "Medium",
-                                        WIND_HIGH: "High"
-                                    }
-                                    wind_direction_names = {
-                                        WIND_LEFT: "East (←)",
-                                        WIND_RIGHT: "West (→)"
-                                    }
-                                    print(f"💨 Syncing wind: {wind_intensity_names.get(current_wind_intensity, 'Unknown')} {wind_direction_names.get(current_wind_direction, 'Unknown')}")
-                                    if send_wind_update(device, current_wind_intensity, current_wind_direction):
-                                        last_wind_intensity = current_wind_intensity
-                                        last_wind_direction = current_wind_direction
-                                    else:
-                                        print("✗ Wind sync failed")
-                            else:
-                                print("⚠ Weather fetch failed")
-
-                # Wait before next iteration
-                time.sleep(0.5)
+                # Sleep until the next attempt is due (or a HID device is plugged in)
+                if device is None:
+                    hotplug_event.wait(max(0.0, next_connect_attempt - time.monotonic()))
                 continue
 
-            # We're connected, periodically check if device is still there
-            if current_time - last_connection_check >= connection_check_interval:
+            # We're connected, check the device is still there after a read error
+            # or hotplug event, and every CONNECTION_CHECK_INTERVAL otherwise
+            if hotplug_event.is_set() or current_time - last_connection_check >= CONNECTION_CHECK_INTERVAL:
+                hotplug_event.clear()
                 last_connection_check = current_time
                 if not is_keyboard_connected():
-                    print("✗ Keyboard disconnected")
-                    print("⏳ Waiting for keyboard to reconnect...\n")
-                    try:
-                        device.close()
-                    except:
-                        pass
-                    device = None
-                    last_volume = None
-                    last_media = None
-                    last_weather = None
-                    last_wind_intensity = None
-                    last_wind_direction = None
+                    log.error("✗ Keyboard disconnected")
+                    device, reader, sent = disconnect_keyboard(device, reader)
                     continue
 
-            # Check for incoming messages from keyboard (non-blocking)
+            # Wait for incoming messages from the reader thread. This doubles as the
+            # loop's sleep, so a game message is handled as soon as it arrives
+            # instead of after the next sleep. Wake up sooner while a volume change
+            # is waiting to settle. Without change notifications the volume is
+            # polled every POLL_INTERVAL; with them, nothing needs polling until
+            # the next periodic check is due.
+            if pending_volume is not None:
+                wait = VOLUME_DEBOUNCE
+            elif volume_watcher is None or not volume_watcher.running:
+                wait = POLL_INTERVAL
+            else:
+                next_due = min(last_connection_check + CONNECTION_CHECK_INTERVAL,
+                               last_media_check + MEDIA_POLL_INTERVAL,
+                               last_volume_check + VOLUME_RECHECK_INTERVAL)
+                if not args.test_date:
+                    next_due = min(next_due, next_datetime_update)
+                if weather_enabled and weather_fetch is None:
+                    next_due = min(next_due, last_weather_check + weather_interval)
+                wait = max(0.0, next_due - time.monotonic())
             try:
-                # Read with very short timeout to not block volume monitoring
-                data = device.read(HID_PACKET_SIZE, timeout_ms=10)
-
-                if data and len(data) > 0:
+                kind, data = events.get(timeout=wait)
+            except queue.Empty:
+                pass
+            else:
+                if kind == 'volume':
+                    volume_changed = True
+                elif kind == 'read_error':
+                    last_connection_check = float('-inf')  # Check the connection next
+                elif kind == 'report':
                     # Process game message
                     if not process_game_message(device, data, score_manager):
                         # Message handling failed, likely disconnected
-                        print("✗ Game message handling failed")
-                        print("⏳ Waiting for keyboard to reconnect...\n")
-                        try:
-                            device.close()
-                        except:
-                            pass
-                        device = None
-                        last_volume = None
-                        last_media = None
-                        last_weather = None
-                        last_wind_intensity = None
-                        last_wind_direction = None
+                        log.error("✗ Game message handling failed")
+                        device, reader, sent = disconnect_keyboard(device, reader)
                         continue
-            except Exception as e:
-                # Read error doesn't necessarily mean disconnection
-                # Will be caught by connection check
-                pass
+                # ('weather', None) only wakes the loop to pick up the finished fetch below
 
-            # Monitor volume and send updates
+            # Poll whatever is due this tick into a snapshot, then send only what changed
             try:
-                current_volume = get_system_volume()
-
-                if current_volume is not None:
-                    # Only send update if volume changed
-                    if current_volume != last_volume:
-                        print(f"🔊 Volume changed: {current_volume}%")
-                        if send_volume_update(device, current_volume):
-                            last_volume = current_volume
-                        else:
-                            # Send failed, likely disconnected
-                            print("✗ Send failed, keyboard may be disconnected")
-                            print("⏳ Waiting for keyboard to reconnect...\n")
-                            try:
-                                device.close()
-                            except:
-                                pass
-                            device = None
-                            last_volume = None
-                            last_media = None
-                            last_weather = None
-                            last_wind_intensity = None
-                            last_wind_direction = None
-                            continue
+                current = replace(sent)
+
+                # With change notifications the volume is only read when it was
+                # reported changed (plus an occasional re-check), otherwise every tick
+                if (volume_watcher is None or not volume_watcher.running or volume_changed or
+                    pending_volume is not None or
+                    current_time - last_volume_check >= VOLUME_RECHECK_INTERVAL):
+                    volume_changed = False
+                    last_volume_check = current_time
+
+                    # Coalesce bursts of volume changes (e.g. dragging a slider) so only
+                    # the value it settles on is sent, while still following long drags.
+                    # Timed on the monotonic clock, read after the event wait above, so
+                    # a wall clock step can't hold a pending volume back.
+                    current_volume = get_system_volume()
+                    now = time.monotonic()
+                    if current_volume is not None and current_volume != sent.volume:
+                        if current_volume != pending_volume:
+                            if pending_volume is None:
+                                pending_volume_start = now
+                            pending_volume = current_volume
+                            pending_volume_time = now
+                        if (now - pending_volume_time >= VOLUME_DEBOUNCE or
+                            now - pending_volume_start >= VOLUME_MAX_DELAY):
+                            current.volume = current_volume
+                            pending_volume = None
+                    else:
+                        pending_volume = None
 
                 # Check media info periodically (every MEDIA_POLL_INTERVAL)
                 if current_time - last_media_check >= MEDIA_POLL_INTERVAL:
                     last_media_check = current_time
-                    current_media = get_current_media()
-
-                    # Send media update if it changed
-                    if current_media != last_media:
-                        if current_media:
-                            print(f"♪ Now playing: {current_media}")
-                        else:
-                            print("♪ Playback stopped")
-
-                        if send_media_update(device, current_media if current_media else ""):
-                            last_media = current_media
-                        else:
-                            # Send failed, likely disconnected
-                            print("✗ Media send failed, keyboard may be disconnected")
-                            print("⏳ Waiting for keyboard to reconnect...\n")
-                            try:
-                                device.close()
-                            except:
-                                pass
-                            device = None
-                            last_volume = None
-                            last_media = None
-                            last_weather = None
-                            last_wind_intensity = None
-                            last_wind_direction = None
-                            continue
-
-                # Periodically send date/time updates (every minute, unless using test date)
-                # If using test date, only send once at connection
-                if not args.test_date and current_time - last_datetime_update >= DATETIME_UPDATE_INTERVAL:
-                    if send_datetime_update(device):
-                        last_datetime_update = current_time
-                    else:
-                        # Send failed, likely disconnected
-                        print("✗ DateTime send failed, keyboard may be disconnected")
-                        print("⏳ Waiting for keyboard to reconnect...\n")
-                        try:
-                            device.close()
-                        except:
-                            pass
-                        device = None
-                        last_volume = None
-                        last_media = None
-                        last_weather = None
-                        last_wind_intensity = None
-                        last_wind_direction = None
-                        continue
-
-                # Periodically check weather and wind (if enabled)
-                if weather_enabled and current_time - last_weather_check >= args.weather_interval:
-                    weather_data = get_current_weather(
+                    current.media = get_current_media()
+
+                # Periodically check weather and wind (if enabled). The fetch runs in the
+                # background so a slow API doesn't stall volume/media/game handling.
+                if weather_enabled and weather_fetch is None and current_time - last_weather_check >= weather_interval:
+                    last_weather_check = current_time
+                    weather_fetch = weather_executor.submit(
+                        get_current_weather,
                         location=weather_location,
                         latitude=weather_latitude,
                         longitude=weather_longitude
                     )
-                    current_weather, current_wind_intensity, current_wind_direction = weather_data
+                    weather_fetch.add_done_callback(lambda future: events.put(('weather', None)))
+
+                if weather_fetch is not None and weather_fetch.done():
+                    current_weather, current_wind_intensity, current_wind_direction = weather_fetch.result()
+                    weather_fetch = None
 
                     if current_weather is not None:
-                        # Send weather update if changed
-                        if current_weather != last_weather:
-                            weather_names = {
-                                WEATHER_SUNNY: "Sunny",
-                                WEATHER_RAIN_LIGHT: "Light Rain",
-                                WEATHER_RAIN_MEDIUM: "Rain",
-                                WEATHER_RAIN_HEAVY: "Heavy Rain",
-                                WEATHER_SNOW_LIGHT: "Light Snow",
-                                WEATHER_SNOW_MEDIUM: "Snow",
-                                WEATHER_SNOW_HEAVY: "Heavy Snow",
-                                WEATHER_CLOUDY: "Partly Cloudy",
-                                WEATHER_OVERCAST: "Overcast"
-                            }
-                            print(f"🌤️  Weather changed: {weather_names.get(current_weather, 'Unknown')}")
-
-                            if send_weather_update(device, current_weather):
-                                last_weather = current_weather
-                                last_weather_check = current_time
-                            else:
-                                # Send failed, likely disconnected
-                                print("✗ Weather send failed, keyboard may be disconnected")
-                                print("⏳ Waiting for keyboard to reconnect...\n")
-                                try:
-                                    device.close()
-                                except:
-                                    pass
-                                device = None
-                                last_volume = None
-                                last_media = None
-                                last_weather = None
-                                last_wind_intensity = None
-                                last_wind_direction = None
-                                continue
-
-                        # Send wind update if available and changed
+                        current.weather = current_weather
                         if current_wind_intensity is not None and current_wind_direction is not None:
-                            if (current_wind_intensity != last_wind_intensity or
-                                current_wind_direction != last_wind_direction):
-                                wind_intensity_names = {
-                                    WIND_NONE: "None",
-                                    WIND_LIGHT: "Light",
-                                    WIND_MEDIUM: "Medium",
-                                    WIND_HIGH: "High"
-                                }
-                                wind_direction_names = {
-                                    WIND_LEFT: "East (←)",
-                                    WIND_RIGHT: "West (→)"
-                                }
-                                print(f"💨 Wind changed: {wind_intensity_names.get(current_wind_intensity, 'Unknown')} {wind_direction_names.get(current_wind_direction, 'Unknown')}")
-
-                                if send_wind_update(device, current_wind_intensity, current_wind_direction):
-                                    last_wind_intensity = current_wind_intensity
-                                    last_wind_direction = current_wind_direction
-                                else:
-                                    print("✗ Wind send failed, keyboard may be disconnected")
-                                    print("⏳ Waiting for keyboard to reconnect...\n")
-                                    try:
-                                        device.close()
-                                    except:
-                                        pass
-                                    device = None
-                                    last_volume = None
-                                    last_media = None
-                                    last_weather = None
-                                    last_wind_intensity = None
-                                    last_wind_direction = None
-                                    last_wind_intensity = None
-                                    last_wind_direction = None
-                                    continue
-
-                        # Update check time
-                        last_weather_check = current_time
+                            current.wind_intensity = current_wind_intensity
+                            current.wind_direction = current_wind_direction
+
+                        # Poll less often while nothing changes, back to normal on any change
+                        weather_result = (current_weather, current_wind_intensity, current_wind_direction)
+                        if weather_result == last_weather_result:
+                            weather_unchanged_count += 1
+                            weather_interval = min(args.weather_interval * 2 ** min(weather_unchanged_count, 3),
+                                                   max(args.weather_interval, WEATHER_MAX_INTERVAL))
+                        else:
+                            weather_unchanged_count = 0
+                            weather_interval = args.weather_interval
+                        last_weather_result = weather_result
                     else:
                         # Weather fetch failed, try again next interval
-                        print("⚠ Weather fetch failed, will retry next interval")
-                        last_weather_check = current_time
+                        log.warning("⚠ Weather fetch failed, will retry next interval")
+
+                if not push_changes(device, current, sent):
+                    # Send failed, likely disconnected
+                    device, reader, sent = disconnect_keyboard(device, reader)
+                    continue
 
-                # Wait before next poll
-                time.sleep(POLL_INTERVAL)
+                # Send date/time when a new minute starts (unless using test date), so
+                # the keyboard's clock flips on time. Only the minute is displayed, so
+                # a wakeup that lands in the already-sent minute sends nothing.
+                # If using test date, only send once at connection
+                if not args.test_date and current_time >= next_datetime_update:
+                    now = datetime.now()
+                    minute = now.replace(second=0, microsecond=0)
+                    if minute != sent_minute:
+                        if send_datetime_update(device, now):
+                            sent_minute = minute
+                        else:
+                            # Send failed, likely disconnected
+                            log.error("✗ DateTime send failed, keyboard may be disconnected")
+                            device, reader, sent = disconnect_keyboard(device, reader)
+                            continue
+                    next_datetime_update = current_time + DATETIME_UPDATE_INTERVAL - (
+                        now.second + now.microsecond / 1e6)
 
             except Exception as e:
                 # Any error during communication, assume disconnected
-                print(f"✗ Connection error: {e}")
-                print("⏳ Waiting for keyboard to reconnect...\n")
-                try:
-                    device.close()
-                except:
-                    pass
-                device = None
-                last_volume = None
-                last_media = None
-                last_weather = None
-                last_wind_intensity = None
-                last_wind_direction = None
+                log.error("✗ Connection error: %s", e)
+                device, reader, sent = disconnect_keyboard(device, reader)
 
     except KeyboardInterrupt:
-        print("\n\n👋 Stopping keyboard companion...")
+        log.info("\n\n👋 Stopping keyboard companion...")
     finally:
+        weather_executor.shutdown(wait=False, cancel_futures=True)
+        if hotplug_observer is not None:
+            hotplug_observer.stop()
+        if volume_watcher is not None:
+            volume_watcher.stop()
         if device is not None:
-            try:
-                device.close()
-            except:
-                pass
+            close_keyboard(device, reader)
 
 
 if __name__ == "__main__":
@@ -925,13 +925,20 @@ void game_hid_receive(uint8_t *data, uint8_t length) {
         g_game.offline_mode = false;  // Computer responded, we're online
 
     } else if (msg_type == MSG_SHOW_SCORES) {
-        // Receive high score list
+        // Receive high score list, split across packets:
+        // [msg, start index, count, entries...] (entry: 3 chars + 2 bytes score = 5 bytes)
+        if (length < 3) return;
+        uint8_t start = data[1];
+        uint8_t count = data[2];
+
         g_game.mode = GAME_SCORE_DISPLAY;
-        g_game.highscore_count = 0;
+        if (start == 0) {
+            g_game.highscore_count = 0;  // First packet starts a new list
+        }
 
-        // Parse high scores (each entry: 3 chars + 2 bytes score = 5 bytes)
-        uint8_t offset = 1;
-        for (uint8_t i = 0; i < 10 && offset + 5 <= length; i++) {
+        uint8_t offset = 3;
+        uint8_t i = start;
+        for (; i < 10 && i < start + count && offset + 5 <= length; i++) {
             // Read name (3 chars)
             g_game.highscores[i].name[0] = data[offset++];
             g_game.highscores[i].name[1] = data[offset++];
@@ -941,8 +948,9 @@ void game_hid_receive(uint8_t *data, uint8_t length) {
             // Read score (2 bytes, big-endian)
             g_game.highscores[i].score = (data[offset] << 8) | data[offset + 1];
             offset += 2;
-
-            g_game.highscore_count++;
+        }
+        if (i > g_game.highscore_count) {
+            g_game.highscore_count = i;
         }
 
         g_game.waiting_for_hid_response = false;
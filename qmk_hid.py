@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Shared Raw HID helpers for the keyboard companion scripts.
+
+KeyboardLocator remembers where the keyboard's Raw HID interface was last
+found, in memory and in a small file in the user's runtime directory, so the
+scripts only walk hid.enumerate() (which lists every HID device in the system)
+when the remembered path can no longer be opened, or (on Linux) no longer
+belongs to the keyboard. On Linux it looks the keyboard up in sysfs before
+falling back to hid.enumerate().
+
+The devices it opens are for sending reports only; on Linux they write
+straight to the hidraw node (see HidrawWriter).
+
+connect_daemon() connects to qmk_hidd.py, which owns the keyboard and takes
+reports from any number of scripts, when it is running and has the keyboard.
+
+report(), datetime_report() and datetime_fields_report() build the Raw HID
+reports the scripts send.
+
+Requirements:
+    - hidapi
+"""
+
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+# hidapi is imported where it is used, so a script that only sends through
+# qmk_hidd.py (or exits on a usage error) never loads it
+
+# Raw HID usage page and usage
+USAGE_PAGE = 0xFF60
+USAGE = 0x0061
+
+# HID packet size (32 bytes for Raw HID); each report has a report ID in front
+HID_PACKET_SIZE = 32
+
+# HID commands (must match keyboard firmware)
+CMD_VOLUME_UPDATE = 0x01
+CMD_MEDIA_UPDATE = 0x02
+CMD_DATETIME_UPDATE = 0x03
+CMD_WEATHER_UPDATE = 0x04
+CMD_WIND_UPDATE = 0x05
+
+# Date/time payload: little-endian 16-bit year, then month, day, hour, minute, second
+DATETIME_PAYLOAD = struct.Struct('<HBBBBB')
+
+
+def runtime_dir():
+    """Return a directory only this user can write to, for the cache and socket.
+
+    That is $XDG_RUNTIME_DIR if set, otherwise a qmk-<uid> directory (mode
+    0700) in the system temp directory. If that name is taken by anything but
+    a private directory of ours, a new private temporary directory is used.
+    """
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return Path(os.environ['XDG_RUNTIME_DIR'])
+    if not hasattr(os, 'getuid'):
+        return Path(tempfile.gettempdir())  # Windows: already per user
+
+    path = Path(tempfile.gettempdir()) / f'qmk-{os.getuid()}'
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+        if stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077:
+            return path
+    except OSError:
+        pass
+    return Path(tempfile.mkdtemp(prefix='qmk-'))
+
+
+# Directory for the remembered device paths (cleared on logout/reboot on Linux)
+CACHE_DIR = runtime_dir()
+
+# Linux lists hidraw nodes here, with each node's IDs and report descriptor
+SYSFS_HIDRAW = Path('/sys/class/hidraw')
+
+# Socket qmk_hidd.py receives reports on (one report per datagram)
+DAEMON_SOCKET = CACHE_DIR / 'qmk.sock'
+
+# Asks qmk_hidd.py whether it has the keyboard open. It replies to this with
+# DAEMON_REPLY holding 1 if it has, 0 if not, and to each report with the
+# number of bytes written to the keyboard, or -1 if it wasn't
+DAEMON_QUERY = b'?'
+DAEMON_REPLY = struct.Struct('<i')
+
+# Seconds to wait for qmk_hidd.py to reply
+DAEMON_TIMEOUT = 2.0
+
+
+class KeyboardLocator:
+    """Finds a keyboard's Raw HID interface and remembers its path."""
+
+    def __init__(self, vendor_id, product_id, usage_page=USAGE_PAGE, usage=USAGE):
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+        self.usage_page = usage_page
+        self.usage = usage
+        self.cache_file = CACHE_DIR / (
+            f'qmk-kbd-{vendor_id:04x}-{product_id:04x}-{usage_page:04x}-{usage:04x}.path')
+        self.path = None
+
+    def enumerate(self):
+        """Walk hid.enumerate() for the keyboard and remember its path.
+
+        Returns the device info dict, or None if the keyboard is not connected.
+        """
+        import hid
+
+        for device_info in hid.enumerate(self.vendor_id, self.product_id):
+            if (device_info['usage_page'] == self.usage_page and
+                device_info['usage'] == self.usage):
+                self.remember(device_info['path'])
+                return device_info
+
+        self.forget()
+        return None
+
+    def remember(self, path):
+        """Store path as the keyboard's location, in memory and in the cache file."""
+        self.path = path
+        try:
+            self.cache_file.write_bytes(path)
+        except OSError:
+            pass
+
+    def forget(self):
+        """Drop the remembered path, so the next lookup enumerates again."""
+        self.path = None
+        try:
+            self.cache_file.unlink()
+        except OSError:
+            pass
+
+    def cached_path(self):
+        """Return the remembered path, or None if there is none."""
+        if self.path is None:
+            try:
+                self.path = self.cache_file.read_bytes() or None
+            except OSError:
+                pass
+        return self.path
+
+    def is_keyboard(self, path):
+        """Check that a remembered /dev/hidrawN node is still the keyboard's interface.
+
+        The kernel hands hidraw numbers out again after a device is unplugged,
+        so the node may now be another device, or another interface of the
+        keyboard. sysfs has its IDs and report descriptor, which is much
+        cheaper to read than enumerating. Paths on other platforms (and
+        hidapi's libusb backend) name the USB port and interface, so they
+        are only checked by opening them.
+        """
+        if not path.startswith(b'/dev/hidraw'):
+            return True
+
+        sysfs = SYSFS_HIDRAW / os.path.basename(os.fsdecode(path)) / 'device'
+        try:
+            uevent = (sysfs / 'uevent').read_text()
+            descriptor = (sysfs / 'report_descriptor').read_bytes()
+        except OSError:
+            return False
+
+        # HID_ID=<bus>:<vendor>:<product>, each as zero-padded hex
+        if f':{self.vendor_id:08X}:{self.product_id:08X}' not in uevent.upper():
+            return False
+        # Raw HID descriptors start with a 2-byte Usage Page item (0x06)
+        return descriptor.startswith(bytes((0x06, self.usage_page & 0xFF, self.usage_page >> 8)))
+
+    def find_hidraw(self):
+        """Find the keyboard's /dev/hidrawN node by reading sysfs (Linux).
+
+        A few tiny sysfs files per node, instead of hidapi's walk over every
+        HID device and its strings. Returns the path, or None if no node
+        matches (or this isn't Linux).
+        """
+        try:
+            names = os.listdir(SYSFS_HIDRAW)
+        except OSError:
+            return None
+
+        for name in sorted(names):
+            path = b'/dev/' + os.fsencode(name)
+            if self.is_keyboard(path):
+                return path
+        return None
+
+    def open_cached(self):
+        """Open the keyboard without enumerating.
+
+        Uses the remembered path or, on Linux, the hidraw node sysfs lists for
+        the keyboard. Returns the device, or None (and forgets the path) if
+        neither is available or can be opened.
+        """
+        path = self.cached_path()
+        if path is not None and not self.is_keyboard(path):
+            self.forget()
+            path = None
+        if path is None:
+            path = self.find_hidraw()
+            if path is None:
+                return None
+            self.remember(path)
+
+        try:
+            return open_path(path)
+        except (OSError, ValueError):
+            self.forget()
+            return None
+
+    def open(self):
+        """Open the keyboard, trying the remembered path before enumerating.
+
+        Returns the device, or None if the keyboard is not connected. Raises
+        OSError (or ValueError) if it was found but could not be opened.
+        """
+        device = self.open_cached()
+        if device:
+            return device
+
+        device_info = self.enumerate()
+        if not device_info:
+            return None
+        return open_path(device_info['path'])
+
+
+class HidrawWriter:
+    """Write-only handle on a Linux /dev/hidrawN node, standing in for a hid.device.
+
+    The node takes the same report (report ID first) as hidapi's write(), so
+    each report is a single os.write() with no hidapi call in between.
+    """
+
+    def __init__(self, path):
+        self.fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+
+    def write(self, report):
+        return os.write(self.fd, report)
+
+    def close(self):
+        os.close(self.fd)
+
+
+def open_path(path):
+    """Open the Raw HID interface at path for sending reports.
+
+    /dev/hidrawN paths (hidapi's Linux hidraw backend) are opened directly as
+    a HidrawWriter, without loading hidapi; anything else goes through hidapi.
+    Raises OSError (or ValueError) if it can't be opened.
+    """
+    if path.startswith(b'/dev/hidraw'):
+        return HidrawWriter(path)
+
+    import hid
+
+    device = hid.device()
+    device.open_path(path)
+    return device
+
+
+class DaemonConnection:
+    """Stands in for an open hid.device, sending each report to qmk_hidd.py.
+
+    write() waits for the daemon's reply, so like hid.device.write() it
+    returns the number of bytes that reached the keyboard, or -1.
+    """
+
+    def __init__(self, sock):
+        self.sock = sock
+
+    def write(self, report):
+        # Drop replies that came in after an earlier write() gave up waiting,
+        # so they aren't taken as the answer to this report. The socket has a
+        # timeout, which recv would wait out even with MSG_DONTWAIT.
+        self.sock.setblocking(False)
+        try:
+            while True:
+                self.sock.recv(DAEMON_REPLY.size)
+        except BlockingIOError:
+            pass
+        finally:
+            self.sock.settimeout(DAEMON_TIMEOUT)
+
+        self.sock.send(report)
+        try:
+            written, = DAEMON_REPLY.unpack(self.sock.recv(DAEMON_REPLY.size))
+        except (socket.timeout, struct.error):
+            return -1
+        return written
+
+    def close(self):
+        address = self.sock.getsockname()
+        self.sock.close()
+        if isinstance(address, str) and address:  # A socket file, not a Linux abstract address
+            try:
+                os.unlink(address)
+                os.rmdir(os.path.dirname(address))
+            except OSError:
+                pass
+
+
+def connect_daemon():
+    """Connect to a running qmk_hidd.py that has the keyboard open.
+
+    Returns a DaemonConnection, or None if the daemon isn't running, doesn't
+    answer, or can't find the keyboard either (or the platform has no Unix
+    domain sockets), in which case open the keyboard directly.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    connection = DaemonConnection(sock)
+    try:
+        # The socket needs an address of its own for the daemon to reply to
+        if sys.platform.startswith('linux'):
+            sock.bind('')  # Autobind to an unused abstract address
+        else:
+            # A socket file in a new directory of its own, so nobody can take the name first
+            sock.bind(os.path.join(tempfile.mkdtemp(prefix='qmk-', dir=CACHE_DIR), 'client.sock'))
+        sock.connect(os.fspath(DAEMON_SOCKET))
+        sock.settimeout(DAEMON_TIMEOUT)
+        sock.send(DAEMON_QUERY)
+        connected, = DAEMON_REPLY.unpack(sock.recv(DAEMON_REPLY.size))
+    except (OSError, struct.error):
+        connected = False
+
+    if not connected:
+        connection.close()
+        return None
+    return connection
+
+
+def report(command, payload=b''):
+    """Build a Raw HID report: report ID 0, the command, then the payload.
+
+    The payload is truncated to fit and the rest of the packet is zero padded.
+    """
+    packet = bytearray(HID_PACKET_SIZE + 1)
+    packet[1] = command
+    payload = payload[:HID_PACKET_SIZE - 1]
+    packet[2:2 + len(payload)] = payload
+    return packet
+
+
+def datetime_report(dt):
+    """Build a date/time report for a datetime.
+
+    Format: [cmd, year_low, year_high, month, day, hour, minute, second]
+    """
+    return datetime_fields_report(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+
+def datetime_fields_report(year, month, day, hour=0, minute=0, second=0):
+    """Build a date/time report from its fields, without a datetime object."""
+    return report(CMD_DATETIME_UPDATE, DATETIME_PAYLOAD.pack(
+        year, month, day, hour, minute, second))
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Raw HID daemon for QMK keyboards.
+
+Owns the keyboard's Raw HID interface and writes reports sent to it by the
+other scripts (display_config.py, display_showcase.py, season_simulator.py,
+test_weather.py, weather_control.py, send_datetime.py, ...), so they can run at the same time and
+don't each have to find and open the keyboard. The scripts use it
+automatically while it is running.
+
+Each report is one datagram on a Unix domain socket in the user's runtime
+directory: the report ID (0) followed by the 32-byte Raw HID packet. Reports
+that arrive together are written in order, except that only the newest of
+several volume/media/date-time/weather/wind updates is sent. A script first
+asks whether the keyboard is connected (DAEMON_QUERY in qmk_hid.py), and
+opens the keyboard itself if the daemon doesn't have it; each report is
+answered with the bytes written to the keyboard (-1 if it wasn't).
+
+Requirements:
+    - hidapi
+    - A platform with Unix domain sockets (Linux, macOS)
+
+Usage:
+    python3 qmk_hidd.py
+"""
+
+import os
+import signal
+import socket
+import sys
+import time
+
+# Import hidapi
+try:
+    import hid
+except ImportError:
+    print("Error: hidapi not installed!")
+    print("Install with: pip3 install hidapi")
+    sys.exit(1)
+
+# Verify we have the right hidapi module
+if not hasattr(hid, 'device'):
+    print("Error: Wrong 'hid' module detected!")
+    print("\nFix this by:")
+    print("  1. Uninstall conflicting packages:")
+    print("     pip3 uninstall hid hidapi")
+    print("  2. Install the correct package:")
+    print("     pip3 install hidapi")
+    sys.exit(1)
+
+from qmk_hid import (
+    CMD_DATETIME_UPDATE, CMD_MEDIA_UPDATE, CMD_VOLUME_UPDATE, CMD_WEATHER_UPDATE,
+    CMD_WIND_UPDATE, DAEMON_QUERY, DAEMON_REPLY, DAEMON_SOCKET, HID_PACKET_SIZE,
+    USAGE, USAGE_PAGE, KeyboardLocator,
+)
+
+# USB Vendor and Product IDs
+VENDOR_ID = 0xFEED
+PRODUCT_ID = 0x0000
+
+# Each report is the HID packet with the report ID in front
+REPORT_SIZE = HID_PACKET_SIZE + 1
+
+# Commands that set display state, where a newer report replaces an older one
+STATE_COMMANDS = {
+    CMD_VOLUME_UPDATE,
+    CMD_MEDIA_UPDATE,
+    CMD_DATETIME_UPDATE,
+    CMD_WEATHER_UPDATE,
+    CMD_WIND_UPDATE,
+}
+
+# Attempts to open the keyboard while it is not connected
+RECONNECT_DELAY = 2.0  # First attempt 2 seconds after losing it...
+RECONNECT_MAX_DELAY = 30.0  # ...backing off to one attempt every 30 seconds
+
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID, USAGE_PAGE, USAGE)
+
+
+def open_keyboard():
+    """Open the keyboard, trying the remembered path before enumerating."""
+    try:
+        return locator.open()
+    except (OSError, ValueError) as e:
+        print(f"✗ Error opening HID device: {e}")
+        return None
+
+
+def bind_socket():
+    """Create the daemon socket, replacing a stale one left by a previous run."""
+    path = os.fspath(DAEMON_SOCKET)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as probe:
+            try:
+                probe.connect(path)
+            except OSError:
+                os.unlink(path)  # Nobody listening, left over from a crash
+            else:
+                print(f"✗ qmk_hidd is already running ({path})")
+                sys.exit(1)
+
+    old_umask = os.umask(0o177)  # Only this user may send reports
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(old_umask)
+    return sock
+
+
+def receive_batch(sock, first):
+    """Collect messages already queued behind `first`, coalescing state updates.
+
+    `first` and the queued messages are (data, sender) pairs from recvfrom().
+    Returns (report, senders) pairs to write, in the order they arrived, and
+    the senders of status queries; of several state updates with the same
+    command, only the newest is kept (in its place), taking over the senders
+    of the ones it replaces.
+    """
+    messages = [first]
+    timeout = sock.gettimeout()
+    sock.setblocking(False)  # With a timeout set, recv waits for it even with MSG_DONTWAIT
+    try:
+        while True:
+            try:
+                messages.append(sock.recvfrom(REPORT_SIZE + 1))
+            except BlockingIOError:
+                break
+    finally:
+        sock.settimeout(timeout)
+
+    batch = []
+    queries = []
+    latest = {}  # State command -> index into batch
+    for report, sender in messages:
+        if report == DAEMON_QUERY:
+            queries.append(sender)
+            continue
+        if len(report) != REPORT_SIZE:
+            print(f"⚠ Ignoring {len(report)}-byte message (expected {REPORT_SIZE} bytes)")
+            continue
+        senders = [sender]
+        command = report[1]
+        if command in STATE_COMMANDS:
+            if command in latest:
+                senders = batch[latest[command]][1] + senders
+                batch[latest[command]] = None
+            latest[command] = len(batch)
+        batch.append((report, senders))
+    return [entry for entry in batch if entry is not None], queries
+
+
+def reply(sock, senders, value):
+    """Send a DAEMON_REPLY to each client in senders still there to receive it."""
+    message = DAEMON_REPLY.pack(value)
+    for sender in senders:
+        if not sender:
+            continue  # Unbound socket, nothing to reply to
+        try:
+            sock.sendto(message, socket.MSG_DONTWAIT, sender)
+        except OSError:
+            pass
+
+
+def write_batch(sock, device, batch):
+    """Write a batch to the keyboard, replying to each report's senders.
+
+    Returns False if a write failed; that report and the rest of the batch
+    are answered with -1.
+    """
+    for i, (report, senders) in enumerate(batch):
+        try:
+            written = device.write(report)
+            if written <= 0:
+                raise OSError("write failed")
+        except (OSError, ValueError) as e:
+            print(f"✗ Keyboard write failed: {e}")
+            for _, unsent in batch[i:]:
+                reply(sock, unsent, -1)
+            return False
+        reply(sock, senders, written)
+    return True
+
+
+def close_device(device):
+    """Close a device handle, ignoring errors from an already-gone device."""
+    try:
+        device.close()
+    except Exception:
+        pass
+
+
+def serve(sock):
+    """Write reports from the socket to the keyboard until interrupted."""
+    device = None
+    reconnect_delay = RECONNECT_DELAY  # Grows while the keyboard stays unplugged
+    next_attempt = 0.0
+    try:
+        while True:
+            if device is None:
+                if time.monotonic() >= next_attempt:
+                    device = open_keyboard()
+                    if device:
+                        print("✓ Connected to keyboard")
+                        reconnect_delay = RECONNECT_DELAY
+                        sock.settimeout(None)
+                    else:
+                        next_attempt = time.monotonic() + reconnect_delay
+                        reconnect_delay = min(reconnect_delay * 1.5, RECONNECT_MAX_DELAY)
+
+                if device is None:
+                    # Keep taking (and dropping) reports until the next attempt
+                    remaining = next_attempt - time.monotonic()
+                    if remaining <= 0:
+                        continue
+                    sock.settimeout(remaining)
+
+            try:
+                first = sock.recvfrom(REPORT_SIZE + 1)
+            except socket.timeout:
+                continue
+
+            batch, queries = receive_batch(sock, first)
+            if queries and device is None:
+                # A client is waiting to hear, so try now rather than at the next attempt
+                device = open_keyboard()
+                if device:
+                    print("✓ Connected to keyboard")
+                    reconnect_delay = RECONNECT_DELAY
+                    sock.settimeout(None)
+            reply(sock, queries, int(device is not None))
+
+            if device is None:
+                if batch:
+                    print(f"⚠ Keyboard not connected, dropped {len(batch)} report(s)")
+                    for _, senders in batch:
+                        reply(sock, senders, -1)
+                continue
+
+            if not write_batch(sock, device, batch):
+                print("⏳ Waiting for keyboard to reconnect...")
+                close_device(device)
+                device = None
+                locator.forget()
+    finally:
+        if device is not None:
+            close_device(device)
+
+
+def main():
+    """Main entry point."""
+    if not hasattr(socket, 'AF_UNIX'):
+        print("✗ qmk_hidd needs Unix domain sockets, which this platform lacks")
+        return 1
+
+    sock = bind_socket()
+    print(f"🎧 Listening on {DAEMON_SOCKET}")
+
+    # Stop cleanly (removing the socket) on SIGTERM as well as Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        serve(sock)
+    except KeyboardInterrupt:
+        print("\n👋 Stopping qmk_hidd")
+    finally:
+        sock.close()
+        try:
+            os.unlink(os.fspath(DAEMON_SOCKET))
+        except OSError:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,7 +26,8 @@ Usage:
 import time
 import sys
 import argparse
-from datetime import datetime
+import queue
+import threading
 
 # Import hidapi
 try:
@@ -46,6 +47,8 @@ if not hasattr(hid, 'device'):
     print("     pip3 install hidapi")
     sys.exit(1)
 
+from qmk_hid import KeyboardLocator, connect_daemon, datetime_fields_report, datetime_report
+
 # USB Vendor and Product IDs
 VENDOR_ID = 0xFEED
 PRODUCT_ID = 0x0000
@@ -54,11 +57,8 @@ PRODUCT_ID = 0x0000
 USAGE_PAGE = 0xFF60
 USAGE = 0x0061
 
-# HID packet size
-HID_PACKET_SIZE = 32
-
-# Command ID for datetime update
-CMD_DATETIME_UPDATE = 0x03
+# Remembers where the keyboard was found, so later runs can skip enumeration
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID, USAGE_PAGE, USAGE)
 
 # Season definitions (matching keymap.c)
 SEASONS = {
@@ -75,61 +75,34 @@ DAY_DURATION = MONTH_DURATION / DAYS_PER_MONTH  # 12 seconds per day
 HOURS_PER_DAY = 24
 HOUR_DURATION = DAY_DURATION / HOURS_PER_DAY  # 0.5 seconds per hour
 
-
-def find_keyboard_device():
-    """Find the keyboard HID device."""
-    print(f"Looking for keyboard (VID: 0x{VENDOR_ID:04X}, PID: 0x{PRODUCT_ID:04X})...")
-
-    # List all HID devices
-    devices = hid.enumerate()
-
-    # Find our keyboard by VID/PID and usage page
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
-
-            print(f"✓ Found keyboard: {device_info['product_string']}")
-            return device_info['path']
-
-    return None
+# Moon phase (day of the lunar cycle) -> emoji for the progress output
+MOON_EMOJIS = {0: "🌑", 7: "🌓", 14: "🌕", 22: "🌗", 29: "🌑"}
 
 
 def connect_to_keyboard():
     """Try to connect to the keyboard. Returns device handle or None."""
-    device_path = find_keyboard_device()
-    if not device_path:
-        return None
+    # Send through qmk_hidd.py while it has the keyboard
+    device = connect_daemon()
+    if device:
+        print("✓ Connected to keyboard through qmk_hidd!\n")
+        return device
 
+    # Reuse the path from the last run; only enumerate if it no longer opens
     try:
-        device = hid.device()
-        device.open_path(device_path)
-        print("✓ Connected to keyboard!\n")
-        return device
-    except Exception as e:
+        device = locator.open()
+    except (OSError, ValueError) as e:
         print(f"✗ Error opening HID device: {e}")
         return None
+    if device:
+        print("✓ Connected to keyboard!\n")
+    return device
 
 
-def send_datetime_update(device, dt):
-    """Send date/time update to keyboard via Raw HID."""
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_DATETIME_UPDATE  # Command ID
-
-    # Pack date/time: year (2 bytes), month, day, hour, minute, second
-    packet[1] = dt.year & 0xFF  # Year low byte
-    packet[2] = (dt.year >> 8) & 0xFF  # Year high byte
-    packet[3] = dt.month
-    packet[4] = dt.day
-    packet[5] = dt.hour
-    packet[6] = dt.minute
-    packet[7] = dt.second
-
+def write_report(device, report):
+    """Write a prebuilt HID report to the keyboard. Returns True on success."""
     try:
         # Send the packet
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(report)
 
         # Check if write was successful
         if bytes_written <= 0:
@@ -141,6 +114,23 @@ def send_datetime_update(device, dt):
         return False
 
 
+def send_datetime_update(device, dt):
+    """Send date/time update to keyboard via Raw HID."""
+    return write_report(device, datetime_report(dt))
+
+
+def sleep_until(deadline):
+    """Sleep until an absolute time.monotonic() deadline.
+
+    Every step is scheduled against a fixed start time rather than sleeping a
+    fixed amount after the previous step, so late wakeups don't accumulate,
+    and the monotonic clock isn't thrown off by NTP or manual clock changes.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
 def get_time_emoji(hour):
     """Get emoji for time of day."""
     if 5 <= hour < 7:
@@ -157,6 +147,10 @@ def get_time_emoji(hour):
         return "🌙"  # Night
 
 
+# Time-of-day emoji for each simulated hour
+TIME_EMOJIS = tuple(get_time_emoji(hour) for hour in range(HOURS_PER_DAY))
+
+
 def get_season_emoji(season_key):
     """Get emoji for season."""
     emojis = {
@@ -168,6 +162,12 @@ def get_season_emoji(season_key):
     return emojis.get(season_key, '🌍')
 
 
+def print_lines(lines):
+    """Print lines from a queue until None arrives (runs on a printer thread)."""
+    for line in iter(lines.get, None):
+        print(line)
+
+
 def simulate_month(device, season_key, month, year=2025):
     """Simulate one month of a season."""
     season = SEASONS[season_key]
@@ -179,49 +179,64 @@ def simulate_month(device, season_key, month, year=2025):
     print(f"Duration: {MONTH_DURATION:.0f} seconds | Days: {DAYS_PER_MONTH} | Hours per day: {HOURS_PER_DAY}")
     print()
 
-    start_time = time.time()
-
     # Spread days across the month to show different moon phases
     # Days: 1, 8, 15, 22, 29 (roughly new moon, first quarter, full, last quarter, new)
     day_numbers = [1, 8, 15, 22, 29]
 
-    for day_index in range(DAYS_PER_MONTH):
-        day = day_numbers[day_index]
+    # Build every report up front so the timed loop only writes
+    reports = [
+        [datetime_fields_report(year, month, day, hour) for hour in range(HOURS_PER_DAY)]
+        for day in day_numbers
+    ]
+    # Moon phase emoji for each simulated day
+    moon_emojis = [MOON_EMOJIS.get((day * 29) // 31, "🌘") for day in day_numbers]
 
-        # Cycle through all hours of the day
-        for hour in range(HOURS_PER_DAY):
-            # Calculate when this hour should occur
-            target_time = start_time + day_index * DAY_DURATION + hour * HOUR_DURATION
+    # Progress goes through a printer thread, so a slow terminal or pipe can't
+    # hold up the timed sends
+    output = queue.SimpleQueue()
+    printer = threading.Thread(target=print_lines, args=(output,), daemon=True)
+    printer.start()
 
-            # Wait until the target time
-            sleep_time = target_time - time.time()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+    start_time = time.monotonic()
 
-            # Create datetime for this moment
-            dt = datetime(year, month, day, hour, 0, 0)
-
-            # Send update to keyboard
-            if not send_datetime_update(device, dt):
-                print("\n✗ Failed to send update. Keyboard may be disconnected.")
-                return False
+    try:
+        for day_index in range(DAYS_PER_MONTH):
+            day = day_numbers[day_index]
+            day_reports = reports[day_index]
+            moon_emoji = moon_emojis[day_index]
+
+            # Cycle through all hours of the day
+            for hour in range(HOURS_PER_DAY):
+                # Calculate when this hour should occur
+                target_time = start_time + day_index * DAY_DURATION + hour * HOUR_DURATION
+
+                # Wait until the target time
+                sleep_until(target_time)
+
+                # Send update to keyboard
+                if not write_report(device, day_reports[hour]):
+                    output.put("\n✗ Failed to send update. Keyboard may be disconnected.")
+                    return False
+
+                # Print progress (update every 6 hours to reduce clutter)
+                if hour % 6 == 0:
+                    time_emoji = TIME_EMOJIS[hour]
+                    elapsed = time.monotonic() - start_time
+                    progress = (elapsed / MONTH_DURATION) * 100
+                    output.put(f"{time_emoji} Day {day:2d} - {hour:02d}:00 {moon_emoji}  [{progress:5.1f}% complete]")
+
+            # Brief summary at end of each day
+            elapsed = time.monotonic() - start_time
+            output.put(f"   └─ Day {day} complete ({elapsed:.1f}s elapsed)")
+
+        # Let the last hour show for its full duration, so a month takes MONTH_DURATION
+        sleep_until(start_time + MONTH_DURATION)
+    finally:
+        # Finish printing before anything else is printed
+        output.put(None)
+        printer.join()
 
-            # Print progress (update every 6 hours to reduce clutter)
-            if hour % 6 == 0:
-                time_emoji = get_time_emoji(hour)
-                elapsed = time.time() - start_time
-                progress = (elapsed / MONTH_DURATION) * 100
-                # Show moon phase info
-                moon_phase = (day * 29) // 31
-                moon_emojis = {0: "🌑", 7: "🌓", 14: "🌕", 22: "🌗", 29: "🌑"}
-                moon_emoji = moon_emojis.get(moon_phase, "🌘")
-                print(f"{time_emoji} Day {day:2d} - {hour:02d}:00 {moon_emoji}  [{progress:5.1f}% complete]")
-
-        # Brief summary at end of each day
-        elapsed = time.time() - start_time
-        print(f"   └─ Day {day} complete ({elapsed:.1f}s elapsed)")
-
-    elapsed = time.time() - start_time
+    elapsed = time.monotonic() - start_time
     print(f"\n✓ {season['name']} complete! (Duration: {elapsed:.1f}s)")
 
     return True
@@ -1,76 +1,163 @@
 #!/usr/bin/env python3
 """
 Send current date and time to the keyboard via HID.
-This script should be run periodically (e.g., every minute) to keep the keyboard's clock synced.
+
+Run once (e.g. from cron every minute) to sync the keyboard's clock, or with
+--daemon to keep the device open and send at the start of every minute.
 """
 
-import hid
+import argparse
+import math
+import signal
+import threading
 import time
 from datetime import datetime
 
+from qmk_hid import KeyboardLocator, connect_daemon, datetime_report
+
 # USB Vendor and Product IDs for the keyboard
 VENDOR_ID = 0xFEED
 PRODUCT_ID = 0x0000  # Update this with your keyboard's product ID
 
-def find_keyboard():
-    """Find the keyboard HID device."""
-    for device in hid.enumerate():
-        if device['vendor_id'] == VENDOR_ID and device['product_id'] == PRODUCT_ID:
-            if device['usage_page'] == 0xFF60 or device['usage'] == 0x61:  # Raw HID
-                return device['path']
-    return None
+# Remembers the device path between runs, so cron runs can skip hid.enumerate()
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID)
+
+# Reconnect attempts in daemon mode
+RECONNECT_DELAY = 5.0  # First retry 5 seconds after losing the keyboard...
+RECONNECT_MAX_DELAY = 60.0  # ...backing off to one attempt a minute
+
+# Set by SIGTERM to end daemon mode
+stop = threading.Event()
 
-def send_datetime(device_path):
-    """Send current date and time to the keyboard."""
+def open_keyboard(use_cache=True):
+    """Open the keyboard (or qmk_hidd.py), trying the remembered path before enumerating."""
+    h = connect_daemon()
+    if h:
+        return h
+
+    if not use_cache:
+        locator.forget()
     try:
-        # Open the device
-        h = hid.device()
-        h.open_path(device_path)
+        h = locator.open()
+    except (OSError, ValueError):
+        return None
+    if h and not use_cache:
+        print(f"Found keyboard at: {locator.path}")
+    return h
 
-        # Get current date/time
+def send_datetime(h, now=None):
+    """Send the date and time (default: now) to an open keyboard device."""
+    if now is None:
         now = datetime.now()
 
-        # Prepare the HID packet (32 bytes for raw HID)
-        # Command 0x03 = Date/Time update
-        # Format: [cmd, year_low, year_high, month, day, hour, minute, second, padding...]
-        packet = [0] * 32
-        packet[0] = 0x03  # Command ID
-        packet[1] = now.year & 0xFF  # Year low byte
-        packet[2] = (now.year >> 8) & 0xFF  # Year high byte
-        packet[3] = now.month
-        packet[4] = now.day
-        packet[5] = now.hour
-        packet[6] = now.minute
-        packet[7] = now.second
-
-        # Send the packet
-        h.write(packet)
+    # Send the packet
+    try:
+        if h.write(datetime_report(now)) <= 0:
+            raise OSError("write failed")
+    except (OSError, ValueError) as e:
+        print(f"Error sending date/time: {e}")
+        return False
+
+    print(f"Sent date/time to keyboard: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+    return True
+
+def close_device(h):
+    """Close a device handle, ignoring errors from an already-gone device."""
+    try:
         h.close()
+    except Exception:
+        pass
 
-        print(f"Sent date/time to keyboard: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-        return True
+def wait_until(deadline):
+    """Wait until the wall clock reaches deadline (a time.time() value) or stop is set.
 
-    except Exception as e:
-        print(f"Error sending date/time: {e}")
-        return False
+    Sends are aligned to whole seconds because the keyboard counts seconds from
+    the time it receives; sending at 12:34:56.9 would leave its clock 0.9s behind.
+    """
+    while not stop.is_set():
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return
+        stop.wait(remaining)
 
-def main():
-    print("Looking for keyboard...")
-    device_path = find_keyboard()
+def send_once():
+    """Open the keyboard, send the time once and close it again."""
+    h = open_keyboard()
+    if h:
+        wait_until(math.ceil(time.time()))
+        if send_datetime(h):
+            close_device(h)
+            return True
+        close_device(h)
+        # The cached path may point at a stale device node; enumerate again
+        h = open_keyboard(use_cache=False)
 
-    if not device_path:
+    if not h:
         print(f"Keyboard not found (VID: 0x{VENDOR_ID:04X}, PID: 0x{PRODUCT_ID:04X})")
         print("Make sure your keyboard is connected and the product ID is correct.")
-        return
+        return False
+
+    try:
+        wait_until(math.ceil(time.time()))
+        return send_datetime(h)
+    finally:
+        close_device(h)
+
+def run_daemon():
+    """Keep the keyboard open and send the time at the start of every minute."""
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    h = None
+    use_cache = True
+    reconnect_delay = RECONNECT_DELAY  # Grows while the keyboard stays unplugged
+    try:
+        while not stop.is_set():
+            if not h:
+                h = open_keyboard(use_cache)
+                use_cache = False
+                if not h:
+                    stop.wait(reconnect_delay)
+                    reconnect_delay = min(reconnect_delay * 1.5, RECONNECT_MAX_DELAY)
+                    continue
+                print("Connected to keyboard")
+                reconnect_delay = RECONNECT_DELAY
+                wait_until(math.ceil(time.time()))
 
-    print(f"Found keyboard at: {device_path}")
+            if not send_datetime(h):
+                # Device went away; re-enumerate on the next attempt
+                close_device(h)
+                h = None
+                stop.wait(RECONNECT_DELAY)
+                continue
 
-    # Send time once
-    send_datetime(device_path)
+            # Next minute boundary; waiting on the wall clock rather than a
+            # fixed sleep means an early wakeup can't send the previous minute
+            wait_until((time.time() // 60 + 1) * 60)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if h:
+            close_device(h)
+    print("Stopped")
+
+def main():
+    parser = argparse.ArgumentParser(description="Send the current date and time to the keyboard")
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep running and send the time at the start of every minute')
+    args = parser.parse_args()
+
+    if args.daemon:
+        run_daemon()
+        return
+
+    print("Looking for keyboard...")
+    if not send_once():
+        return
 
     print("\nTo keep the clock synced, run this script periodically.")
     print("For example, add to crontab:")
     print("  */1 * * * * /usr/bin/python3 /path/to/send_datetime.py")
+    print("Or keep it running with: python3 send_datetime.py --daemon")
 
 if __name__ == "__main__":
     main()
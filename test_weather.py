@@ -14,6 +14,7 @@ Usage:
 
 import time
 import sys
+import itertools
 import argparse
 
 # Import hidapi - handle potential import issues
@@ -34,6 +35,8 @@ if not hasattr(hid, 'device'):
     print("     pip3 install hidapi")
     sys.exit(1)
 
+from qmk_hid import KeyboardLocator, connect_daemon, report
+
 # USB Vendor and Product IDs (same as keyboard_monitor.py)
 VENDOR_ID = 0xFEED
 PRODUCT_ID = 0x0000
@@ -42,8 +45,8 @@ PRODUCT_ID = 0x0000
 USAGE_PAGE = 0xFF60
 USAGE = 0x0061
 
-# HID packet size
-HID_PACKET_SIZE = 32
+# Remembers where the keyboard was found, so later runs can skip enumeration
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID, USAGE_PAGE, USAGE)
 
 # Command ID for weather updates
 CMD_WEATHER_UPDATE = 0x04
@@ -65,32 +68,26 @@ WEATHER_MAP = {
     "snow": WEATHER_SNOW,
 }
 
+# Interactive mode commands that send a weather state (name or menu number)
+WEATHER_COMMANDS = {
+    **WEATHER_MAP,
+    "1": WEATHER_SUNNY,
+    "2": WEATHER_RAIN,
+    "3": WEATHER_SNOW,
+}
 
-def find_keyboard_device():
-    """Find the keyboard HID device."""
-    print(f"🔍 Looking for keyboard (VID: 0x{VENDOR_ID:04X}, PID: 0x{PRODUCT_ID:04X})...")
-
-    devices = hid.enumerate()
-
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
-            print(f"✓ Found keyboard: {device_info['product_string']}")
-            return device_info['path']
-
-    return None
+# Complete HID reports (report ID 0 + 32-byte packet) for each weather state,
+# built once so a send is a single write of a ready-made buffer
+WEATHER_REPORTS = {
+    state: bytes(report(CMD_WEATHER_UPDATE, bytes([state])))
+    for state in WEATHER_NAMES
+}
 
 
 def send_weather_update(device, weather_state):
     """Send weather update to keyboard via Raw HID."""
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_WEATHER_UPDATE
-    packet[1] = weather_state
-
     try:
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(WEATHER_REPORTS[weather_state])
 
         if bytes_written <= 0:
             print(f"✗ Write failed: {bytes_written} bytes written")
@@ -102,6 +99,23 @@ def send_weather_update(device, weather_state):
         return False
 
 
+def cycle_weather(device, interval):
+    """Send each weather state in turn, every `interval` seconds, until Ctrl+C."""
+    # Sends are scheduled against fixed monotonic deadlines, so send time
+    # doesn't make the cycle drift
+    deadline = time.monotonic()
+    for weather_state in itertools.cycle(WEATHER_REPORTS):
+        print(f"➜ Sending: {WEATHER_NAMES[weather_state]}")
+        if send_weather_update(device, weather_state):
+            print("  ✓ Sent successfully\n")
+        else:
+            print("  ✗ Send failed\n")
+        deadline += interval
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
 def interactive_mode(device):
     """Interactive mode: user selects weather states."""
     print("\n" + "=" * 60)
@@ -119,42 +133,21 @@ def interactive_mode(device):
         try:
             choice = input("Enter command: ").strip().lower()
 
-            if choice in ['q', 'quit', 'exit']:
+            if choice in ('q', 'quit', 'exit'):
                 print("\n👋 Exiting weather simulator")
                 break
 
-            elif choice in ['c', 'cycle']:
-                print("\n🔄 Cycling through weather states (Ctrl+C to stop)...")
+            elif choice in ('c', 'cycle'):
+                print("\n🔄 Cycling through weather states (Ctrl+C to stop)...\n")
                 try:
-                    interval = 3  # Default 3 seconds
-                    while True:
-                        for weather_state in [WEATHER_SUNNY, WEATHER_RAIN, WEATHER_SNOW]:
-                            print(f"\n➜ Sending: {WEATHER_NAMES[weather_state]}")
-                            if send_weather_update(device, weather_state):
-                                print("  ✓ Sent successfully")
-                            else:
-                                print("  ✗ Send failed")
-                            time.sleep(interval)
+                    cycle_weather(device, interval=3)  # Default 3 seconds
                 except KeyboardInterrupt:
                     print("\n⏸️  Cycle stopped")
 
-            elif choice in ['1', 'sunny']:
-                print(f"\n➜ Sending: {WEATHER_NAMES[WEATHER_SUNNY]}")
-                if send_weather_update(device, WEATHER_SUNNY):
-                    print("  ✓ Sent successfully")
-                else:
-                    print("  ✗ Send failed")
-
-            elif choice in ['2', 'rain']:
-                print(f"\n➜ Sending: {WEATHER_NAMES[WEATHER_RAIN]}")
-                if send_weather_update(device, WEATHER_RAIN):
-                    print("  ✓ Sent successfully")
-                else:
-                    print("  ✗ Send failed")
-
-            elif choice in ['3', 'snow']:
-                print(f"\n➜ Sending: {WEATHER_NAMES[WEATHER_SNOW]}")
-                if send_weather_update(device, WEATHER_SNOW):
+            elif choice in WEATHER_COMMANDS:
+                weather_state = WEATHER_COMMANDS[choice]
+                print(f"\n➜ Sending: {WEATHER_NAMES[weather_state]}")
+                if send_weather_update(device, weather_state):
                     print("  ✓ Sent successfully")
                 else:
                     print("  ✗ Send failed")
@@ -199,23 +192,22 @@ Examples:
 
     args = parser.parse_args()
 
-    # Find keyboard
-    device_path = find_keyboard_device()
-    if not device_path:
+    # Send through qmk_hidd.py while it has the keyboard, otherwise reuse the
+    # path from the last run and only enumerate if it no longer opens
+    device = connect_daemon()
+    if not device:
+        try:
+            device = locator.open()
+        except (OSError, ValueError) as e:
+            print(f"✗ Error opening HID device: {e}")
+            sys.exit(1)
+    if not device:
         print("✗ Keyboard not found!")
         print("\nMake sure:")
         print("  1. Keyboard is connected")
         print("  2. VID/PID match your keyboard (check keyboard_monitor.py)")
         sys.exit(1)
-
-    # Connect to keyboard
-    try:
-        device = hid.device()
-        device.open_path(device_path)
-        print("✓ Connected to keyboard\n")
-    except Exception as e:
-        print(f"✗ Error opening HID device: {e}")
-        sys.exit(1)
+    print("✓ Connected to keyboard\n")
 
     try:
         # Command-line mode
@@ -224,14 +216,7 @@ Examples:
                 print(f"🔄 Cycling through weather states ({args.interval}s intervals)")
                 print("   Press Ctrl+C to stop\n")
                 try:
-                    while True:
-                        for weather_state in [WEATHER_SUNNY, WEATHER_RAIN, WEATHER_SNOW]:
-                            print(f"➜ Sending: {WEATHER_NAMES[weather_state]}")
-                            if send_weather_update(device, weather_state):
-                                print("  ✓ Sent successfully\n")
-                            else:
-                                print("  ✗ Send failed\n")
-                            time.sleep(args.interval)
+                    cycle_weather(device, args.interval)
                 except KeyboardInterrupt:
                     print("\n👋 Cycle stopped")
             else:
@@ -18,20 +18,22 @@ Usage:
     # Combined weather and wind
     python3 weather_control.py rain --wind high left
 
+    # Only print errors
+    python3 weather_control.py -q rain
+
+Commands go through qmk_hidd.py when it is running, so each invocation is a
+single datagram instead of a HID enumeration and open.
+
 Requirements:
     pip3 install hidapi
 """
 
+import argparse
+import logging
 import sys
 import time
 
-# Import hidapi
-try:
-    import hid
-except ImportError:
-    print("Error: hidapi not installed!")
-    print("Install with: pip3 install hidapi")
-    sys.exit(1)
+from qmk_hid import KeyboardLocator, connect_daemon, report
 
 # USB Vendor and Product IDs for your keyboard
 VENDOR_ID = 0xFEED
@@ -41,8 +43,15 @@ PRODUCT_ID = 0x0000
 USAGE_PAGE = 0xFF60
 USAGE = 0x0061
 
-# HID packet size (32 bytes for Raw HID)
-HID_PACKET_SIZE = 32
+# Remembers where the keyboard was found, so later runs can skip enumeration
+locator = KeyboardLocator(VENDOR_ID, PRODUCT_ID, USAGE_PAGE, USAGE)
+
+# Seconds each weather condition is shown in demo mode
+CYCLE_INTERVAL = 5.0
+
+# Progress messages are logged at INFO, which --quiet hides; errors are
+# always printed
+log = logging.getLogger('weather_control')
 
 # HID commands
 CMD_WEATHER_CONTROL = 0x04
@@ -104,37 +113,46 @@ WIND_DIRECTION_NAMES = {
     'right': WIND_RIGHT
 }
 
+# Valid names, sorted once for the argument choices and error messages
+WEATHER_CHOICES = sorted(WEATHER_NAMES)
+WIND_INTENSITY_CHOICES = sorted(WIND_INTENSITY_NAMES)
+
+# Weather conditions demo mode cycles through, in order
+WEATHER_CYCLE = (
+    ('sunny', WEATHER_SUNNY),
+    ('cloudy', WEATHER_CLOUDY),
+    ('overcast', WEATHER_OVERCAST),
+    ('light-rain', WEATHER_RAIN_LIGHT),
+    ('rain', WEATHER_RAIN_MEDIUM),
+    ('heavy-rain', WEATHER_RAIN_HEAVY),
+    ('light-snow', WEATHER_SNOW_LIGHT),
+    ('snow', WEATHER_SNOW_MEDIUM),
+    ('heavy-snow', WEATHER_SNOW_HEAVY)
+)
+
+# Display names for the wind values (the name maps above have aliases)
+WIND_INTENSITY_DISPLAY = {
+    WIND_NONE: 'none',
+    WIND_LIGHT: 'light',
+    WIND_MEDIUM: 'medium',
+    WIND_HIGH: 'high'
+}
 
-def find_keyboard():
-    """Find the keyboard HID device."""
-    print(f"Looking for keyboard (VID: 0x{VENDOR_ID:04X}, PID: 0x{PRODUCT_ID:04X})...")
-
-    # List all HID devices
-    devices = hid.enumerate()
-
-    # Find our keyboard by VID/PID and usage page
-    for device_info in devices:
-        if (device_info['vendor_id'] == VENDOR_ID and
-            device_info['product_id'] == PRODUCT_ID and
-            device_info['usage_page'] == USAGE_PAGE and
-            device_info['usage'] == USAGE):
-
-            print(f"✓ Found keyboard: {device_info['product_string']}")
-            return device_info['path']
+WIND_DIRECTION_DISPLAY = {
+    WIND_LEFT: 'left',
+    WIND_RIGHT: 'right'
+}
 
-    return None
 
+def send_command(device, command, *values):
+    """Send a command with its byte values to the keyboard."""
+    return write_report(device, report(command, bytes(values)))
 
-def send_weather_command(device, weather_state):
-    """Send weather control command to keyboard."""
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_WEATHER_CONTROL
-    packet[1] = weather_state
 
+def write_report(device, packet):
+    """Write a complete HID report to the keyboard. Returns True on success."""
     try:
-        # Send the packet (first byte is report ID, usually 0)
-        bytes_written = device.write([0] + list(packet))
+        bytes_written = device.write(packet)
 
         if bytes_written <= 0:
             print(f"✗ Write failed: {bytes_written} bytes written")
@@ -146,157 +164,191 @@ def send_weather_command(device, weather_state):
         return False
 
 
-def send_wind_command(device, intensity, direction):
-    """Send wind control command to keyboard."""
-    # Create HID packet (32 bytes)
-    packet = bytearray(HID_PACKET_SIZE)
-    packet[0] = CMD_WIND_CONTROL
-    packet[1] = intensity
-    packet[2] = direction
-
-    try:
-        # Send the packet (first byte is report ID, usually 0)
-        bytes_written = device.write([0] + list(packet))
+def send_weather_command(device, weather_state):
+    """Send weather control command to keyboard."""
+    return send_command(device, CMD_WEATHER_CONTROL, weather_state)
 
-        if bytes_written <= 0:
-            print(f"✗ Write failed: {bytes_written} bytes written")
-            return False
 
-        return True
-    except Exception as e:
-        print(f"✗ Error sending HID packet: {e}")
-        return False
+def send_wind_command(device, intensity, direction):
+    """Send wind control command to keyboard."""
+    return send_command(device, CMD_WIND_CONTROL, intensity, direction)
 
 
 def cycle_all_weather(device):
     """Cycle through all weather conditions."""
-    # Weather conditions to cycle through in order
-    weather_cycle = [
-        ('sunny', WEATHER_SUNNY),
-        ('cloudy', WEATHER_CLOUDY),
-        ('overcast', WEATHER_OVERCAST),
-        ('light-rain', WEATHER_RAIN_LIGHT),
-        ('rain', WEATHER_RAIN_MEDIUM),
-        ('heavy-rain', WEATHER_RAIN_HEAVY),
-        ('light-snow', WEATHER_SNOW_LIGHT),
-        ('snow', WEATHER_SNOW_MEDIUM),
-        ('heavy-snow', WEATHER_SNOW_HEAVY)
+    # Build every report up front so the timed loop only writes
+    reports = [
+        (weather_name, report(CMD_WEATHER_CONTROL, bytes([weather_state])))
+        for weather_name, weather_state in WEATHER_CYCLE
     ]
 
-    print("🔄 Cycling through all weather conditions (5 seconds each)...")
-    print("   Press Ctrl+C to stop")
-    print()
+    log.info("🔄 Cycling through all weather conditions (%g seconds each)...", CYCLE_INTERVAL)
+    log.info("   Press Ctrl+C to stop")
+    log.info("")
 
+    # Changes are scheduled against fixed deadlines on the monotonic clock, so
+    # the time spent sending doesn't add up over a long demo run
+    deadline = time.monotonic()
     try:
         while True:
-            for weather_name, weather_state in weather_cycle:
-                print(f"📤 Setting weather: {weather_name}")
-                if send_weather_command(device, weather_state):
-                    print(f"✓ Weather set to: {weather_name}")
+            for weather_name, packet in reports:
+                log.info("📤 Setting weather: %s", weather_name)
+                if write_report(device, packet):
+                    log.info("✓ Weather set to: %s", weather_name)
                 else:
                     print(f"✗ Failed to set weather: {weather_name}")
 
-                # Wait 5 seconds before next weather
-                time.sleep(5)
-                print()
+                # Wait until it is time for the next weather
+                deadline += CYCLE_INTERVAL
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                log.info("")
     except KeyboardInterrupt:
-        print()
-        print("⏹  Weather cycling stopped")
+        log.info("")
+        log.info("⏹  Weather cycling stopped")
 
 
-def main():
-    # Parse arguments
-    args = sys.argv[1:]
-
-    # Check if running in demo mode (no arguments)
-    demo_mode = len(args) == 0
-
-    weather_name = None
-    weather_state = None
-    wind_intensity = None
-    wind_direction = WIND_RIGHT  # Default direction
-
-    # Parse wind arguments
-    if '--wind' in args:
-        wind_index = args.index('--wind')
-
-        # Check if wind intensity is provided
-        if wind_index + 1 < len(args):
-            wind_intensity_name = args[wind_index + 1].lower()
-
-            if wind_intensity_name not in WIND_INTENSITY_NAMES:
-                print(f"✗ Invalid wind intensity: {wind_intensity_name}")
-                print(f"Valid options: {', '.join(sorted(WIND_INTENSITY_NAMES.keys()))}")
-                sys.exit(1)
-
-            wind_intensity = WIND_INTENSITY_NAMES[wind_intensity_name]
-
-            # Check if wind direction is provided (optional, defaults to right)
-            if wind_index + 2 < len(args):
-                wind_direction_name = args[wind_index + 2].lower()
-
-                if wind_direction_name in WIND_DIRECTION_NAMES:
-                    wind_direction = WIND_DIRECTION_NAMES[wind_direction_name]
-                    # Remove direction from args if it was consumed
-                    args.pop(wind_index + 2)
-
-            # Remove wind arguments
-            args.pop(wind_index + 1)  # Remove intensity
-            args.pop(wind_index)      # Remove --wind
-        else:
-            print("✗ --wind requires an intensity (none/light/medium/high)")
-            sys.exit(1)
-
-    # Parse weather argument (if any remaining after removing wind args)
-    if not demo_mode and len(args) > 0:
-        weather_name = args[0].lower()
-
-        if weather_name not in WEATHER_NAMES:
-            print(f"✗ Invalid weather: {weather_name}")
-            print(f"Valid options: {', '.join(sorted(set(WEATHER_NAMES.keys())))}")
-            sys.exit(1)
+def open_keyboard():
+    """Open the keyboard, or exit if it can't be found or opened."""
+    # Send through qmk_hidd.py while it has the keyboard, otherwise reuse the
+    # path from the last run and only enumerate if it no longer opens
+    device = connect_daemon()
+    if device:
+        return device
 
-        weather_state = WEATHER_NAMES[weather_name]
-
-    # Find keyboard
-    device_path = find_keyboard()
-    if not device_path:
-        print("✗ Keyboard not found!")
-        print("Make sure the keyboard is plugged in.")
+    # hidapi is only loaded to open the keyboard directly, so --help,
+    # usage errors and sends through qmk_hidd.py don't pay for it
+    try:
+        import hid  # noqa: F401
+    except ImportError:
+        print("Error: hidapi not installed!")
+        print("Install with: pip3 install hidapi")
         sys.exit(1)
 
-    # Open device
     try:
-        device = hid.device()
-        device.open_path(device_path)
-        print("✓ Connected to keyboard")
-        print()
-    except Exception as e:
+        device = locator.open()
+    except (OSError, ValueError) as e:
         print(f"✗ Error opening device: {e}")
         sys.exit(1)
+    if not device:
+        print("✗ Keyboard not found!")
+        print("Make sure the keyboard is plugged in.")
+        sys.exit(1)
+    return device
+
+
+class WindAction(argparse.Action):
+    """Parse --wind INTENSITY [DIRECTION] into (intensity, direction) values.
+
+    The second value is only taken as the direction if it is one, so a weather
+    name can follow (--wind high rain); whatever is left over is stored in
+    after_wind for parse_args() to treat as the weather.
+    """
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        intensity, *rest = values
+        if intensity not in WIND_INTENSITY_NAMES:
+            parser.error(f"invalid wind intensity: {intensity} "
+                         f"(choose from {', '.join(WIND_INTENSITY_CHOICES)})")
+
+        direction = WIND_RIGHT  # Default direction
+        if rest and rest[0] in WIND_DIRECTION_NAMES:
+            direction = WIND_DIRECTION_NAMES[rest.pop(0)]
+
+        setattr(namespace, self.dest, (WIND_INTENSITY_NAMES[intensity], direction))
+        namespace.after_wind = rest
+
+
+def parse_args():
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        description="Send weather and wind control commands to the keyboard",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python3 weather_control.py                       # Cycle through all weather conditions
+  python3 weather_control.py rain                  # Send medium rain
+  python3 weather_control.py --wind light left     # Set light wind blowing left
+  python3 weather_control.py rain --wind high left # Combined weather and wind
+  python3 weather_control.py --wind high left rain # Same, with the weather last
+  python3 weather_control.py -q snow               # Only print errors
+        """
+    )
+    parser.add_argument(
+        'weather',
+        nargs='?',
+        type=str.lower,
+        choices=WEATHER_CHOICES,
+        metavar='WEATHER',
+        help=f"Weather to send: {', '.join(WEATHER_CHOICES)}"
+    )
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Only print errors (useful when run from scripts or cron)'
+    )
+    parser.add_argument(
+        '--wind',
+        nargs='+',
+        type=str.lower,
+        action=WindAction,
+        metavar=('INTENSITY', 'DIRECTION'),
+        help=(f"Wind intensity ({'/'.join(WIND_INTENSITY_NAMES)}) and optional "
+              f"direction ({'/'.join(WIND_DIRECTION_NAMES)}, default: right)")
+    )
+    parser.set_defaults(after_wind=[])
+    args = parser.parse_args()
+
+    # --wind takes everything up to the next option, including a weather
+    # name given after it
+    if args.after_wind:
+        if args.weather is not None or len(args.after_wind) > 1:
+            parser.error(f"unrecognized arguments: {' '.join(args.after_wind)}")
+        if args.after_wind[0] not in WEATHER_NAMES:
+            parser.error(f"invalid wind direction or weather: {args.after_wind[0]} "
+                         f"(directions: {', '.join(WIND_DIRECTION_NAMES)}; "
+                         f"weather: {', '.join(WEATHER_CHOICES)})")
+        args.weather = args.after_wind[0]
+    return args
+
+
+def main():
+    args = parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
+
+    device = open_keyboard()
+    log.info("✓ Connected to keyboard")
+    log.info("")
 
-    if demo_mode:
-        # Cycle through all weather conditions
+    if args.weather is None and args.wind is None:
+        # No arguments: cycle through all weather conditions
         cycle_all_weather(device)
     else:
         # Send weather command if provided
-        if weather_state is not None:
-            print(f"📤 Sending weather command: {weather_name}")
-            if send_weather_command(device, weather_state):
-                print(f"✓ Weather transition started: {weather_name}")
-                print(f"⏱  Transition will complete in ~30 seconds")
+        if args.weather is not None:
+            log.info("📤 Sending weather command: %s", args.weather)
+            if send_weather_command(device, WEATHER_NAMES[args.weather]):
+                log.info("✓ Weather transition started: %s", args.weather)
+                log.info("⏱  Transition will complete in ~30 seconds")
             else:
                 print("✗ Failed to send weather command")
                 sys.exit(1)
 
         # Send wind command if provided
-        if wind_intensity is not None:
-            intensity_name = [k for k, v in WIND_INTENSITY_NAMES.items() if v == wind_intensity][0]
-            direction_name = [k for k, v in WIND_DIRECTION_NAMES.items() if v == wind_direction][0]
+        if args.wind is not None:
+            wind_intensity, wind_direction = args.wind
+            intensity_name = WIND_INTENSITY_DISPLAY[wind_intensity]
+            direction_name = WIND_DIRECTION_DISPLAY[wind_direction]
 
-            print(f"💨 Sending wind command: {intensity_name} {direction_name}")
+            log.info("💨 Sending wind command: %s %s", intensity_name, direction_name)
             if send_wind_command(device, wind_intensity, wind_direction):
-                print(f"✓ Wind set to: {intensity_name} blowing {direction_name}")
+                log.info("✓ Wind set to: %s blowing %s", intensity_name, direction_name)
             else:
                 print("✗ Failed to send wind command")
                 sys.exit(1)